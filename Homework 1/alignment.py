@@ -0,0 +1,213 @@
+"""
+Pairwise sequence alignment (Needleman-Wunsch / Smith-Waterman) with NumPy.
+
+Hamming distance (Problem 3) only handles substitutions; alignment also allows
+insertions and deletions. The DP matrix H[i, j] only depends on H[i-1, j-1],
+H[i-1, j] and H[i, j-1], so all cells on one anti-diagonal (i + j = d) can be
+filled with a single vectorized step. Scores use a linear gap penalty.
+
+- score only: keeps just the last two anti-diagonals, so memory is linear.
+- full alignment: also stores one traceback byte per cell to rebuild the gapped strings.
+- band: only cells with |i - j| <= band are filled.
+- batch: align_many() aligns one query against many targets at once by stacking
+  the targets as rows of the anti-diagonal arrays.
+
+Example:
+    alignment_score("GATTACA", "GCATGCT")                       # global score
+    align("GATTACA", "GCATGCT", local=True).aligned_one         # local alignment
+    align_many("CAG", ["CCAG", "CAT", "GGG"], local=True)       # array of scores
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+NEG = np.int64(-(1 << 40))  # "minus infinity" that cannot overflow when a penalty is added
+STOP, DIAGONAL, UP, LEFT = 0, 1, 2, 3
+BATCH_CELLS = 1 << 22  # targets x query length processed together by align_many
+
+Alignment = namedtuple("Alignment", "score aligned_one aligned_two start_one end_one start_two end_two")
+
+
+def _encode(sequence):
+    if isinstance(sequence, str):
+        return np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(bytes(sequence), dtype=np.uint8)
+
+
+def _check_band(band, n, m, local):
+    if band is None:
+        return
+    if band < 0:
+        raise ValueError("band must not be negative.")
+    if not local and abs(n - m) > band:
+        raise ValueError(f"A global alignment of lengths {n} and {m} needs band >= {abs(n - m)}.")
+
+
+def _sweep(query, targets, lengths, match, mismatch, gap, local, band, trace):
+    """
+    Fill the DP matrix anti-diagonal by anti-diagonal for every target row at once.
+
+    Args: query - (n,) uint8 codes along i
+          targets - (T, m) uint8 codes along j, padded past each target's length
+          lengths - (T,) true target lengths; padding never feeds cells with j <= length
+          trace - also record traceback moves (only meaningful for T == 1)
+
+    Returns: (scores, best_cell, directions) - best_cell/directions are None unless trace is set
+    """
+    n = len(query)
+    n_targets, m = targets.shape
+    older = np.full((n_targets, n + 1), NEG, dtype=np.int64)   # anti-diagonal d - 2
+    newer = np.full((n_targets, n + 1), NEG, dtype=np.int64)   # anti-diagonal d - 1
+    newer[:, 0] = 0  # anti-diagonal 0 is the single cell H[0, 0]
+
+    if local:
+        scores = np.zeros(n_targets, dtype=np.int64)
+    else:
+        scores = np.full(n_targets, NEG, dtype=np.int64)
+        scores[lengths + n == 0] = 0
+    directions = np.zeros((n + 1, m + 1), dtype=np.uint8) if trace else None
+    best_cell = (0, 0) if local else (n, m)
+    best_score = 0
+
+    for d in range(1, n + m + 1):
+        low, high = max(0, d - m), min(n, d)
+        if band is not None:
+            # |i - j| = |2i - d| <= band
+            low, high = max(low, (d - band + 1) // 2), min(high, (d + band) // 2)
+        if low > high:
+            older.fill(NEG)
+            older, newer = newer, older
+            continue
+
+        i = np.arange(low, high + 1)
+        j = d - i
+        values = np.empty((n_targets, len(i)), dtype=np.int64)
+        moves = np.empty(len(i), dtype=np.uint8)
+
+        inner = (i > 0) & (j > 0)
+        ii, jj = i[inner], j[inner]
+        if len(ii):
+            substitution = np.where(targets[:, jj - 1] == query[ii - 1], match, mismatch)
+            diagonal = older[:, ii - 1] + substitution
+            up = newer[:, ii - 1] + gap
+            left = newer[:, ii] + gap
+            best = np.maximum(diagonal, np.maximum(up, left))
+            if local:
+                best = np.maximum(best, 0)
+            values[:, inner] = best
+            if trace:
+                move = np.where(best[0] == diagonal[0], DIAGONAL, np.where(best[0] == up[0], UP, LEFT))
+                moves[inner] = np.where(best[0] == 0, STOP, move) if local else move
+
+        # First row and first column: free in local mode, gap penalties in global mode.
+        edge = ~inner
+        values[:, edge] = 0 if local else (i[edge] + j[edge]) * gap
+        if trace:
+            moves[edge] = STOP if local else np.where(i[edge] == 0, LEFT, UP)
+            moves[(i == 0) & (j == 0)] = STOP
+            directions[i, j] = moves
+
+        if local:
+            masked = np.where(j[None, :] <= lengths[:, None], values, NEG)
+            scores = np.maximum(scores, masked.max(axis=1))
+            if trace:
+                k = int(np.argmax(values[0]))
+                if values[0, k] > best_score:
+                    best_score = int(values[0, k])
+                    best_cell = (int(i[k]), int(j[k]))
+        else:
+            finished = lengths + n == d
+            if finished.any() and low <= n <= high:
+                scores[finished] = values[finished, n - low]
+
+        older.fill(NEG)
+        older[:, low:high + 1] = values
+        older, newer = newer, older
+    return scores, (best_cell if trace else None), directions
+
+
+def _traceback(one, two, directions, cell):
+    """Rebuild the gapped strings by walking the traceback moves back from `cell`."""
+    i, j = cell
+    end_one, end_two = i, j
+    top, bottom = [], []
+    while True:
+        move = directions[i, j]
+        if move == DIAGONAL:
+            top.append(one[i - 1])
+            bottom.append(two[j - 1])
+            i, j = i - 1, j - 1
+        elif move == UP:
+            top.append(one[i - 1])
+            bottom.append("-")
+            i -= 1
+        elif move == LEFT:
+            top.append("-")
+            bottom.append(two[j - 1])
+            j -= 1
+        else:
+            break
+    return "".join(reversed(top)), "".join(reversed(bottom)), i, end_one, j, end_two
+
+
+def alignment_score(seq_one, seq_two, local=False, match=1, mismatch=-1, gap=-2, band=None):
+    """
+    Best alignment score in linear memory (only two anti-diagonals are kept).
+
+    Args: local - Smith-Waterman (True) or Needleman-Wunsch (False)
+          match, mismatch, gap - scores for a match, a substitution and each gap position
+          band - optional maximum |i - j| of the cells that are filled
+    """
+    return int(align_many(seq_one, [seq_two], local, match, mismatch, gap, band)[0])
+
+
+def align(seq_one, seq_two, local=False, match=1, mismatch=-1, gap=-2, band=None):
+    """
+    Full alignment with traceback (one byte per DP cell).
+
+    Returns: Alignment(score, aligned_one, aligned_two, start_one, end_one, start_two, end_two),
+             where [start, end) are the aligned ranges of each input
+    """
+    one, two = _encode(seq_one), _encode(seq_two)
+    _check_band(band, len(one), len(two), local)
+    scores, cell, directions = _sweep(one, two[None, :], np.array([len(two)]),
+                                      match, mismatch, gap, local, band, trace=True)
+    text_one = one.tobytes().decode("ascii")
+    text_two = two.tobytes().decode("ascii")
+    aligned_one, aligned_two, start_one, end_one, start_two, end_two = \
+        _traceback(text_one, text_two, directions, cell)
+    return Alignment(int(scores[0]), aligned_one, aligned_two, start_one, end_one, start_two, end_two)
+
+
+def align_many(query, targets, local=False, match=1, mismatch=-1, gap=-2, band=None):
+    """
+    Score one query against many targets; each batch of targets is swept together.
+
+    Returns: int64 array of scores, one per target
+    """
+    query = _encode(query)
+    encoded = [_encode(target) for target in targets]
+    for target in encoded:
+        _check_band(band, len(query), len(target), local)
+    scores = np.zeros(len(encoded), dtype=np.int64)
+    per_batch = max(1, BATCH_CELLS // (len(query) + 1))
+    for start in range(0, len(encoded), per_batch):
+        batch = encoded[start:start + per_batch]
+        lengths = np.array([len(target) for target in batch], dtype=np.int64)
+        padded = np.zeros((len(batch), int(lengths.max())), dtype=np.uint8)
+        for row, target in enumerate(batch):
+            padded[row, :len(target)] = target
+        scores[start:start + len(batch)] = _sweep(query, padded, lengths, match, mismatch, gap,
+                                                  local, band, trace=False)[0]
+    return scores
+
+
+def needleman_wunsch(seq_one, seq_two, **scoring):
+    """Global alignment; see align() for the scoring keywords."""
+    return align(seq_one, seq_two, local=False, **scoring)
+
+
+def smith_waterman(seq_one, seq_two, **scoring):
+    """Local alignment; see align() for the scoring keywords."""
+    return align(seq_one, seq_two, local=True, **scoring)
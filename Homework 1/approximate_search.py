@@ -0,0 +1,142 @@
+"""
+Approximate motif search: every position where a motif matches with at most k mismatches.
+
+The notebook only finds exact occurrences and never uses hamming_distance to
+search. ApproximateMatcher packs the mRNA once (see packed_sequence.py) and offers
+two engines:
+
+- scan: bit-parallel comparison of the motif against every window. The motif is
+  cut into pieces of up to 32 bases; each piece is XOR-ed against the packed
+  k-mer of every window and the mismatches are counted with popcount, so a whole
+  32-base piece is compared in one word operation for all positions at once.
+- seed: pigeonhole seed-and-verify. If the motif is split into k + 1 seeds, any
+  match with at most k mismatches contains at least one seed exactly. Seeds are
+  looked up in a sorted k-mer index of the sequence and only those candidate
+  windows are verified.
+
+The seed engine is used for longer motifs, where seeds are selective enough to
+beat a full scan.
+
+Example:
+    matcher = ApproximateMatcher(mRNA)
+    positions, mismatches = matcher.search("CAG", k=1)
+"""
+
+import numpy as np
+
+from packed_sequence import BASES_PER_WORD, PackedSequence, count_mismatches
+
+MIN_SEED_LENGTH = 12  # shorter seeds hit too many random windows to pay off
+
+
+class ApproximateMatcher:
+    """
+    Reusable k-mismatch search over one A/C/G/T sequence.
+
+    Args: sequence - str, bytes or PackedSequence to search
+    """
+
+    def __init__(self, sequence):
+        self.sequence = sequence if isinstance(sequence, PackedSequence) else PackedSequence(sequence)
+        self._kmers = {}
+        self._seed_index = {}
+
+    def _kmer_array(self, length):
+        """Packed k-mers of every window of the given length, cached per length."""
+        if length not in self._kmers:
+            self._kmers[length] = self.sequence.kmers(length)
+        return self._kmers[length]
+
+    def _pieces(self, motif):
+        """Split the motif into (offset, length, code) pieces of up to 32 bases."""
+        pieces = []
+        for offset in range(0, len(motif), BASES_PER_WORD):
+            piece = motif[offset:offset + BASES_PER_WORD]
+            pieces.append((offset, len(piece), np.uint64(piece.words[0])))
+        return pieces
+
+    def _mismatches_at(self, motif, starts):
+        """Mismatch count of the motif at each given start position."""
+        total = np.zeros(len(starts), dtype=np.int64)
+        for offset, length, code in self._pieces(motif):
+            total += count_mismatches(self._kmer_array(length)[starts + offset], code)
+        return total
+
+    def scan(self, motif, k):
+        """Bit-parallel scan of every window. Returns (positions, mismatches) int64 arrays."""
+        motif = _as_packed(motif)
+        windows = len(self.sequence) - len(motif) + 1
+        if windows <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        total = np.zeros(windows, dtype=np.int64)
+        for offset, length, code in self._pieces(motif):
+            total += count_mismatches(self._kmer_array(length)[offset:offset + windows], code)
+        positions = np.flatnonzero(total <= k)
+        return positions, total[positions]
+
+    def seed_and_verify(self, motif, k, seed_length=None):
+        """
+        Pigeonhole seed lookup followed by verification of the candidate windows.
+
+        Args: seed_length - length of each of the k + 1 seeds; defaults to len(motif) // (k + 1), capped at 32
+
+        Returns: (positions, mismatches) int64 arrays
+        """
+        motif = _as_packed(motif)
+        if seed_length is None:
+            seed_length = min(BASES_PER_WORD, len(motif) // (k + 1))
+        if not 0 < seed_length <= BASES_PER_WORD or seed_length * (k + 1) > len(motif):
+            raise ValueError(f"Cannot split a motif of length {len(motif)} into {k + 1} seeds of length {seed_length}.")
+        last_start = len(self.sequence) - len(motif)
+        if last_start < 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        sorted_codes, order = self._seeds(seed_length)
+        candidates = []
+        for seed in range(k + 1):
+            offset = seed * seed_length
+            code = np.uint64(motif.kmer(offset, seed_length))
+            low = np.searchsorted(sorted_codes, code, side="left")
+            high = np.searchsorted(sorted_codes, code, side="right")
+            candidates.append(order[low:high] - offset)
+        starts = np.unique(np.concatenate(candidates))
+        starts = starts[(starts >= 0) & (starts <= last_start)]
+
+        total = self._mismatches_at(motif, starts)
+        keep = total <= k
+        return starts[keep], total[keep]
+
+    def _seeds(self, seed_length):
+        """Sorted k-mer index for one seed length: (sorted codes, positions in the same order)."""
+        if seed_length not in self._seed_index:
+            codes = self._kmer_array(seed_length)
+            order = np.argsort(codes, kind="stable")
+            self._seed_index[seed_length] = (codes[order], order.astype(np.int64))
+        return self._seed_index[seed_length]
+
+    def search(self, motif, k=0):
+        """
+        Every start position where the motif matches with at most k mismatches.
+
+        Chooses the seed engine when k + 1 seeds of at least MIN_SEED_LENGTH bases fit in
+        the motif, and the bit-parallel scan otherwise.
+
+        Returns: (positions, mismatches) - sorted int64 positions and their mismatch counts
+        """
+        if k < 0:
+            raise ValueError("k must not be negative.")
+        motif = _as_packed(motif)
+        if len(motif) == 0:
+            raise ValueError("Motif must be a non-empty string.")
+        if len(motif) // (k + 1) >= MIN_SEED_LENGTH:
+            return self.seed_and_verify(motif, k)
+        return self.scan(motif, k)
+
+
+def _as_packed(motif):
+    return motif if isinstance(motif, PackedSequence) else PackedSequence(motif)
+
+
+def find_approximate(sequence, motif, k=0):
+    """Convenience wrapper: search one sequence for one motif with at most k mismatches."""
+    return ApproximateMatcher(sequence).search(motif, k)
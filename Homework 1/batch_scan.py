@@ -0,0 +1,136 @@
+"""
+Batch scanner for files holding many HW1 records.
+
+HW1shortData.txt holds one record of four lines: the mRNA, the motif, and the two
+strings compared by hamming_distance. This script reads a file of many such
+records, sends them to a process pool in chunks and writes one result line per
+record to the output file, in input order. Records are read lazily and only a
+bounded number of chunks are in flight, so memory does not grow with the file.
+
+Output (tab separated): record number, motif start positions (space separated),
+Hamming distance, error message (empty when the record was processed).
+
+Usage:
+    python batch_scan.py records.txt results.tsv --workers 8 --chunk-size 2000
+"""
+
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from hamming import hamming_distance
+from motif_search import find_motif
+
+LINES_PER_RECORD = 4
+
+
+def read_records(fileName):
+    """Yield (record_number, lines) for every group of four non-blank lines."""
+    with open(fileName, "r") as file:
+        lines = []
+        record_number = 0
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            lines.append(line)
+            if len(lines) == LINES_PER_RECORD:
+                yield record_number, lines
+                record_number += 1
+                lines = []
+        if lines:
+            yield record_number, lines
+
+
+def scan_record(record):
+    """
+    Motif positions and Hamming distance for one record.
+
+    Returns: (record_number, positions, distance, error) - error is "" on success
+    """
+    record_number, lines = record
+    if len(lines) != LINES_PER_RECORD:
+        return record_number, [], None, f"expected {LINES_PER_RECORD} lines, found {len(lines)}"
+    mRNA, motif, string_one, string_two = lines
+    try:
+        positions = find_motif(mRNA, motif).tolist()
+        distance = hamming_distance(string_one, string_two)
+    except (ValueError, TypeError, UnicodeEncodeError) as error:
+        return record_number, [], None, str(error)
+    return record_number, positions, distance, ""
+
+
+def scan_chunk(records):
+    return [scan_record(record) for record in records]
+
+
+def _chunks(records, chunk_size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def format_result(result):
+    record_number, positions, distance, error = result
+    distance = "" if distance is None else str(distance)
+    return f"{record_number}\t{' '.join(map(str, positions))}\t{distance}\t{error}\n"
+
+
+def run_batch(input_file, output_file, workers=None, chunk_size=1000):
+    """
+    Scan every record of input_file and write the results to output_file in input order.
+
+    Args: workers - number of worker processes (default: all CPUs); 1 runs in-process
+          chunk_size - records sent to a worker at a time
+
+    Returns: number of records processed
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(read_records(input_file), chunk_size)
+    processed = 0
+    with open(output_file, "w") as out:
+        if workers == 1:
+            for chunk in chunks:
+                out.writelines(format_result(result) for result in scan_chunk(chunk))
+                processed += len(chunk)
+            return processed
+
+        max_pending = 2 * workers
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(scan_chunk, chunk))
+                # Futures are drained oldest first, which keeps the output in input order.
+                while len(pending) >= max_pending:
+                    results = pending.popleft().result()
+                    out.writelines(format_result(result) for result in results)
+                    processed += len(results)
+            while pending:
+                results = pending.popleft().result()
+                out.writelines(format_result(result) for result in results)
+                processed += len(results)
+    return processed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan many HW1 records (mRNA, motif, two Hamming strings).")
+    parser.add_argument("input_file")
+    parser.add_argument("output_file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per task")
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0 or (args.workers is not None and args.workers <= 0):
+        parser.error("--workers and --chunk-size must be positive")
+    count = run_batch(args.input_file, args.output_file, args.workers, args.chunk_size)
+    print(f"Processed {count} records into {args.output_file}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
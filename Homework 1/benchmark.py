@@ -0,0 +1,171 @@
+"""
+Benchmark suite for the Homework 1 sequence-analysis routines.
+
+Generates synthetic sequences of configurable length, alphabet and motif count,
+then times the notebook code paths (re.finditer per motif and the generator-based
+hamming_distance) against the faster engines in this folder. For every run it
+records the wall time, throughput in bases per second and peak traced memory,
+and writes everything to a JSON results file so regressions show up as diffs.
+
+Usage:
+    python benchmark.py --lengths 10000 100000 1000000 --motif-count 100 --output benchmark_results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from approximate_search import ApproximateMatcher
+from fm_index import FMIndex
+from hamming import hamming_distance, hamming_one_to_many
+from motif_search import MotifAutomaton
+from packed_sequence import PackedSequence
+
+
+def notebook_motif_scan(mRNA, motifs):
+    """The hw1short.ipynb motif scan: one re.finditer pass per motif."""
+    return {motif: [match.start() for match in re.finditer(motif, mRNA)] for motif in motifs}
+
+
+def notebook_hamming_distance(string_one, string_two):
+    """The hw1short.ipynb hamming_distance, kept verbatim apart from the print."""
+    if len(string_one) != len(string_two):
+        return -1
+    return sum(string_one[i] != string_two[i] for i in range(len(string_one)))
+
+
+def random_sequence(length, alphabet, rng):
+    return "".join(rng.choices(alphabet, k=length))
+
+
+def mutate(sequence, rate, alphabet, rng):
+    """Copy of the sequence with roughly `rate` of its positions replaced."""
+    bases = list(sequence)
+    for position in rng.sample(range(len(bases)), int(len(bases) * rate)):
+        bases[position] = rng.choice(alphabet)
+    return "".join(bases)
+
+
+def measure(function, *args, repeat=3):
+    """
+    Run function(*args) `repeat` times.
+
+    Returns: (best wall time in seconds, peak traced memory in bytes of one run)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def benchmark_cases(length, alphabet, motif_count, motif_length, rng):
+    """Yield (group, engine, bases processed, callable, args) for one input size."""
+    mRNA = random_sequence(length, alphabet, rng)
+    motifs = list({random_sequence(motif_length, alphabet, rng) for _ in range(motif_count)})
+    scanned = length * len(motifs)
+
+    yield "motif_search", "re.finditer (notebook)", scanned, notebook_motif_scan, (mRNA, motifs)
+    yield "motif_search", "MotifAutomaton", scanned, lambda s, m: MotifAutomaton(m).search(s), (mRNA, motifs)
+    fm_index = FMIndex.build(mRNA)
+    yield "motif_search", "FMIndex build", length, FMIndex.build, (mRNA,)
+    yield "motif_search", "FMIndex locate", scanned, fm_index.locate_many, (motifs,)
+
+    other = mutate(mRNA, 0.1, alphabet, rng)
+    yield "hamming", "generator (notebook)", length, notebook_hamming_distance, (mRNA, other)
+    yield "hamming", "numpy uint8", length, hamming_distance, (mRNA, other)
+    if set(alphabet) <= set("ACGT"):
+        packed_one, packed_two = PackedSequence(mRNA), PackedSequence(other)
+        yield "hamming", "packed popcount", length, packed_one.hamming, (packed_two,)
+
+        read_length = min(100, length)
+        reads = [mRNA[i:i + read_length] for i in range(0, length - read_length + 1, read_length)]
+        yield "hamming", "numpy one-to-many", read_length * len(reads), hamming_one_to_many, (reads[0], reads)
+
+        matcher = ApproximateMatcher(packed_one)
+        yield "approximate", "scan k=1", scanned, lambda m: [matcher.scan(motif, 1) for motif in m], (motifs,)
+
+
+def run(lengths, alphabet, motif_count, motif_length, repeat, seed):
+    rng = random.Random(seed)
+    results = []
+    for length in lengths:
+        for group, engine, bases, function, args in benchmark_cases(length, alphabet, motif_count, motif_length, rng):
+            seconds, peak = measure(function, *args, repeat=repeat)
+            results.append({
+                "group": group,
+                "engine": engine,
+                "length": length,
+                "bases": bases,
+                "seconds": seconds,
+                "bases_per_second": bases / seconds if seconds > 0 else None,
+                "peak_bytes": peak,
+            })
+            print(f"{group:13s} {engine:24s} n={length:<10d} {seconds * 1e3:10.3f} ms "
+                  f"{bases / max(seconds, 1e-12):14.0f} bases/s  peak {peak / 1024:10.1f} KiB")
+    return results
+
+
+def compare(results, baseline_file, tolerance):
+    """
+    Compare results against an earlier results file.
+
+    Returns: list of (group, engine, length, old seconds, new seconds) that got slower than tolerance allows
+    """
+    with open(baseline_file) as file:
+        baseline = {(r["group"], r["engine"], r["length"]): r["seconds"] for r in json.load(file)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get((result["group"], result["engine"], result["length"]))
+        if old is not None and result["seconds"] > old * (1 + tolerance):
+            regressions.append((result["group"], result["engine"], result["length"], old, result["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Homework 1 motif search and Hamming routines.")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--alphabet", default="ACGT")
+    parser.add_argument("--motif-count", type=int, default=100)
+    parser.add_argument("--motif-length", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=5630)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.lengths, args.alphabet, args.motif_count, args.motif_length, args.repeat, args.seed)
+    report = {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "parameters": vars(args),
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for group, engine, length, old, new in regressions:
+            print(f"REGRESSION {group} {engine} n={length}: {old * 1e3:.3f} ms -> {new * 1e3:.3f} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Sliding-window composition statistics (GC content, GC/AT skew) via prefix sums.
+
+Counting bases separately in every window costs O(n * w). Composition builds one
+prefix-sum array per base (A, C, G, T) once; the count of a base in any window
+[s, s + w) is then prefix[s + w] - prefix[s], so every window size, or many window
+sizes, costs O(n) NumPy work. stream_composition() does the same over a
+memory-mapped file, chunk by chunk, for sequences that do not fit in memory.
+
+Example:
+    composition = Composition(mRNA)
+    composition.gc_content(20)                   # one value per window start
+    composition.many_windows([10, 50, 100])      # {window: gc content array}
+"""
+
+import numpy as np
+
+from packed_sequence import code_table
+from sequence_reader import SequenceFile
+
+BASES = "ACGT"
+STATISTICS = ("gc_content", "gc_skew", "at_skew")
+
+_CODE = code_table(4)  # 4 = anything that is not A/C/G/T
+
+
+class Composition:
+    """
+    Per-base prefix sums of one sequence.
+
+    Args: sequence - str or bytes; bases other than A/C/G/T/U count towards the
+          window length but towards none of the four bases
+    """
+
+    def __init__(self, sequence):
+        raw = sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+        codes = _CODE[np.frombuffer(raw, dtype=np.uint8)]
+        self.length = len(codes)
+        dtype = np.int32 if self.length < 2 ** 31 else np.int64
+        self.prefix = np.zeros((4, self.length + 1), dtype=dtype)
+        for code in range(4):
+            np.cumsum(codes == code, out=self.prefix[code, 1:])
+
+    def __len__(self):
+        return self.length
+
+    def window_starts(self, window, step=1):
+        if window <= 0 or step <= 0:
+            raise ValueError("window and step must be positive.")
+        return np.arange(0, max(self.length - window + 1, 0), step)
+
+    def counts(self, window, step=1, starts=None):
+        """
+        Base counts per window.
+
+        Returns: (4, n_windows) array of A, C, G, T counts for windows [s, s + window)
+        """
+        if starts is None:
+            starts = self.window_starts(window, step)
+        return self.prefix[:, starts + window] - self.prefix[:, starts]
+
+    def statistic(self, name, window, step=1, starts=None):
+        """Compute one of STATISTICS for every window."""
+        counts = self.counts(window, step, starts).astype(np.float64)
+        a, c, g, t = counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if name == "gc_content":
+                return (g + c) / window
+            if name == "gc_skew":
+                return (g - c) / (g + c)      # NaN where the window has no G or C
+            if name == "at_skew":
+                return (a - t) / (a + t)      # NaN where the window has no A or T
+        raise ValueError(f"Unknown statistic {name!r}; expected one of {STATISTICS}.")
+
+    def gc_content(self, window, step=1):
+        return self.statistic("gc_content", window, step)
+
+    def gc_skew(self, window, step=1):
+        return self.statistic("gc_skew", window, step)
+
+    def at_skew(self, window, step=1):
+        return self.statistic("at_skew", window, step)
+
+    def many_windows(self, windows, name="gc_content", step=1):
+        """Dictionary - key is window size, value is the statistic for every window of that size."""
+        return {window: self.statistic(name, window, step) for window in windows}
+
+
+def stream_composition(fileName, window, step=1, index=0, chunk_size=1 << 22, statistics=STATISTICS):
+    """
+    Window statistics over one line of a large file without loading the line.
+
+    The line is read in chunks overlapping by window - 1 bases, so every window lies
+    entirely inside the chunk its start belongs to.
+
+    Returns: generator of (starts, {statistic name: values}) per chunk, starts in line coordinates
+    """
+    if window <= 0 or step <= 0:
+        raise ValueError("window and step must be positive.")
+    with SequenceFile(fileName) as seq_file:
+        for offset, chunk in seq_file.iter_chunks(index, chunk_size, overlap=window - 1):
+            composition = Composition(chunk)
+            first = (-offset) % step  # keep the step grid aligned across chunks
+            last = min(chunk_size, len(chunk) - window + 1)
+            local_starts = np.arange(first, max(last, first), step)
+            if not len(local_starts):
+                continue
+            values = {name: composition.statistic(name, window, starts=local_starts) for name in statistics}
+            yield local_starts + offset, values
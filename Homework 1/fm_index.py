@@ -0,0 +1,178 @@
+"""
+Build-once FM-index (suffix array + BWT) for repeated motif queries on one mRNA.
+
+Every re.finditer call in hw1short.ipynb rescans the whole mRNA. FMIndex sorts the
+suffixes of the sequence once; afterwards count() needs one backward-search step
+per motif base, and locate() reads the matching suffix-array interval, so queries
+no longer depend on the sequence length. The index is written to a directory of
+.npy files and reopened with memory-mapping, so later runs skip the build.
+
+Example:
+    index = FMIndex.build(mRNA)
+    index.save("mrna.fmi")
+    index = FMIndex.load("mrna.fmi")
+    index.count("CAG"), index.locate("CAG")
+"""
+
+import json
+import os
+
+import numpy as np
+
+OCC_STEP = 64  # BWT positions between stored occurrence checkpoints
+_FORMAT_VERSION = 1
+
+
+def _as_bytes(sequence):
+    if isinstance(sequence, str):
+        return sequence.encode("ascii")
+    return bytes(sequence)
+
+
+def suffix_array(codes):
+    """
+    Suffix array by prefix doubling, vectorized with NumPy.
+
+    Args: codes - integer array whose last element is a unique, smallest sentinel
+
+    Returns: int64 array of suffix start positions in lexicographic order
+    """
+    n = len(codes)
+    rank = codes.astype(np.int64)
+    sa = np.argsort(rank, kind="stable")
+    step = 1
+    while step < n:
+        second = np.full(n, -1, dtype=np.int64)
+        second[:n - step] = rank[step:]
+        sa = np.lexsort((second, rank))
+        first_key = rank[sa]
+        second_key = second[sa]
+        changed = (first_key[1:] != first_key[:-1]) | (second_key[1:] != second_key[:-1])
+        rank = np.empty(n, dtype=np.int64)
+        rank[sa] = np.concatenate(([0], np.cumsum(changed)))
+        if rank[sa[-1]] == n - 1:
+            break
+        step *= 2
+    return sa
+
+
+class FMIndex:
+    """
+    FM-index over a single sequence.
+
+    Use FMIndex.build() for a new sequence or FMIndex.load() for a saved one.
+
+    Attributes: alphabet - bytes of the symbols in the sequence (sentinel excluded)
+                sa - suffix array; bwt - Burrows-Wheeler transform as symbol codes
+                counts_before - C array: number of symbols smaller than each code
+                occ - occurrence checkpoints every OCC_STEP positions of the BWT
+    """
+
+    def __init__(self, alphabet, sa, bwt, counts_before, occ):
+        self.alphabet = alphabet
+        self.sa = sa
+        self.bwt = bwt
+        self.counts_before = counts_before
+        self.occ = occ
+        # Code 0 is the sentinel; symbols not in the alphabet have no code.
+        self._code = {symbol: code for code, symbol in enumerate(alphabet, start=1)}
+
+    @classmethod
+    def build(cls, sequence):
+        text = _as_bytes(sequence)
+        if b"\0" in text:
+            raise ValueError("Sequence must not contain NUL bytes (reserved for the sentinel).")
+        raw = np.frombuffer(text, dtype=np.uint8)
+        alphabet = bytes(np.unique(raw).tolist())
+        lookup = np.zeros(256, dtype=np.uint8)
+        lookup[np.frombuffer(alphabet, dtype=np.uint8)] = np.arange(1, len(alphabet) + 1)
+        codes = np.append(lookup[raw], np.uint8(0))
+
+        n = len(codes)
+        sa = suffix_array(codes)
+        bwt = codes[(sa - 1) % n]
+
+        sigma = len(alphabet) + 1
+        symbol_counts = np.bincount(codes, minlength=sigma)
+        counts_before = np.concatenate(([0], np.cumsum(symbol_counts)[:-1])).astype(np.int64)
+
+        # occ[j, c] = number of code c in bwt[:j * OCC_STEP]
+        n_checkpoints = n // OCC_STEP + 1
+        one_hot = np.zeros((n_checkpoints * OCC_STEP, sigma), dtype=np.uint8)
+        one_hot[np.arange(n), bwt] = 1
+        per_block = one_hot.reshape(n_checkpoints, OCC_STEP, sigma).sum(axis=1, dtype=np.int64)
+        occ = np.zeros((n_checkpoints, sigma), dtype=np.int64)
+        occ[1:] = np.cumsum(per_block, axis=0)[:-1]
+
+        index_dtype = np.int32 if n < 2 ** 31 else np.int64
+        return cls(alphabet, sa.astype(index_dtype), bwt, counts_before, occ.astype(index_dtype))
+
+    def __len__(self):
+        """Length of the indexed sequence (without the sentinel)."""
+        return len(self.bwt) - 1
+
+    def _rank(self, code, position):
+        """Number of `code` symbols in bwt[:position]."""
+        checkpoint = position // OCC_STEP
+        start = checkpoint * OCC_STEP
+        return int(self.occ[checkpoint, code]) + int(np.count_nonzero(self.bwt[start:position] == code))
+
+    def interval(self, motif):
+        """
+        Backward search: the suffix-array interval [low, high) of suffixes starting with motif.
+
+        Returns: (low, high); low == high when the motif does not occur
+        """
+        low, high = 0, len(self.bwt)
+        for symbol in reversed(_as_bytes(motif)):
+            code = self._code.get(symbol)
+            if code is None:
+                return 0, 0
+            low = int(self.counts_before[code]) + self._rank(code, low)
+            high = int(self.counts_before[code]) + self._rank(code, high)
+            if low >= high:
+                return 0, 0
+        return low, high
+
+    def count(self, motif):
+        """Number of (overlapping) occurrences of the motif."""
+        if not motif:
+            raise ValueError("Motif must be a non-empty string.")
+        low, high = self.interval(motif)
+        return high - low
+
+    def locate(self, motif):
+        """Sorted int64 array of every (overlapping) start position of the motif."""
+        if not motif:
+            raise ValueError("Motif must be a non-empty string.")
+        low, high = self.interval(motif)
+        return np.sort(np.asarray(self.sa[low:high], dtype=np.int64))
+
+    def count_many(self, motifs):
+        """int64 array of occurrence counts, one per motif."""
+        return np.array([self.count(motif) for motif in motifs], dtype=np.int64)
+
+    def locate_many(self, motifs):
+        """Dictionary - key is motif, value is the sorted array of its start positions."""
+        return {motif: self.locate(motif) for motif in motifs}
+
+    def save(self, directory):
+        """Write the index as .npy arrays plus a small JSON header into `directory`."""
+        os.makedirs(directory, exist_ok=True)
+        for name in ("sa", "bwt", "counts_before", "occ"):
+            np.save(os.path.join(directory, name + ".npy"), getattr(self, name))
+        header = {"version": _FORMAT_VERSION, "alphabet": list(self.alphabet), "occ_step": OCC_STEP}
+        with open(os.path.join(directory, "header.json"), "w") as file:
+            json.dump(header, file)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Open a saved index; with mmap=True the arrays are memory-mapped instead of read."""
+        with open(os.path.join(directory, "header.json")) as file:
+            header = json.load(file)
+        if header.get("version") != _FORMAT_VERSION or header.get("occ_step") != OCC_STEP:
+            raise ValueError(f"Unsupported FM-index format in {directory}.")
+        mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(directory, name + ".npy"), mmap_mode=mode)
+                  for name in ("sa", "bwt", "counts_before", "occ")}
+        return cls(bytes(header["alphabet"]), **arrays)
@@ -0,0 +1,151 @@
+"""
+Vectorized Hamming distance for the Homework 1 sequences.
+
+The notebook version of hamming_distance compares one character at a time in a
+Python generator and returns -1 on a length mismatch. Here sequences are encoded
+as uint8 arrays and compared with NumPy, one-to-many and all-pairs. Both modes
+work in blocks so the temporary comparison arrays stay within a memory budget. Bad input raises ValueError/TypeError instead of printing.
+
+Example:
+    hamming_distance("AGCTAG", "ACTTAG")                 # 2
+    hamming_matrix(["AGCTAG", "ACTTAG", "AGCTAA"])       # 3 x 3 distance matrix
+"""
+
+import numpy as np
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes allowed for one block of comparisons
+
+
+def encode(sequence):
+    """
+    Encode a single sequence as a uint8 array (one byte per base, no copy for bytes input).
+
+    Args: sequence - str, bytes or uint8 array
+
+    Returns: 1-D uint8 array
+    """
+    if isinstance(sequence, str):
+        return np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    if isinstance(sequence, (bytes, bytearray, memoryview)):
+        return np.frombuffer(sequence, dtype=np.uint8)
+    if isinstance(sequence, np.ndarray):
+        if sequence.ndim != 1:
+            raise ValueError(f"Expected a 1-D sequence array, got shape {sequence.shape}.")
+        return sequence.astype(np.uint8, copy=False)
+    raise TypeError(f"Cannot encode {type(sequence).__name__} as a sequence.")
+
+
+def encode_many(sequences):
+    """
+    Encode equal-length sequences as the rows of a 2-D uint8 array.
+
+    Args: sequences - iterable of str/bytes, or an existing 2-D uint8 array
+
+    Returns: (n, length) uint8 array
+    """
+    if isinstance(sequences, np.ndarray) and sequences.ndim == 2:
+        return sequences.astype(np.uint8, copy=False)
+    if isinstance(sequences, (str, bytes)):
+        raise TypeError("Expected a collection of sequences, not a single sequence.")
+    rows = [encode(sequence) for sequence in sequences]
+    if not rows:
+        raise ValueError("At least one sequence is required.")
+    length = len(rows[0])
+    for index, row in enumerate(rows):
+        if len(row) != length:
+            raise ValueError(f"Sequence {index} has length {len(row)}, expected {length}.")
+    return np.vstack(rows)
+
+
+def _distance_dtype(length):
+    """Smallest unsigned dtype that can hold a distance of up to `length`."""
+    if length < 2 ** 8:
+        return np.uint8
+    if length < 2 ** 16:
+        return np.uint16
+    return np.uint32
+
+
+def hamming_distance(string_one, string_two):
+    """
+    Count the positions at which two equal-length sequences differ.
+
+    Raises: ValueError if the lengths differ
+    """
+    one = encode(string_one)
+    two = encode(string_two)
+    if len(one) != len(two):
+        raise ValueError(f"Strings must be of equal length ({len(one)} != {len(two)}).")
+    return int(np.count_nonzero(one != two))
+
+
+def hamming_one_to_many(query, sequences, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Hamming distance from one query to every row of a collection, computed block by block.
+
+    Rows are compared rows_per_block at a time so the boolean comparison array fits in
+    memory_budget bytes; a row longer than the budget is compared a slice at a time.
+
+    Args: query - one sequence
+          sequences - n sequences of the query's length (or an (n, length) uint8 array)
+          memory_budget - bytes allowed for one block of comparisons
+
+    Returns: 1-D array of distances, one per sequence, using the smallest unsigned dtype that fits
+    """
+    query = encode(query)
+    matrix = encode_many(sequences)
+    length = len(query)
+    if matrix.shape[1] != length:
+        raise ValueError(f"Query has length {length}, sequences have length {matrix.shape[1]}.")
+    if memory_budget <= 0:
+        raise ValueError("memory_budget must be positive.")
+
+    result = np.zeros(len(matrix), dtype=_distance_dtype(length))
+    rows_per_block = max(1, memory_budget // max(length, 1))
+    positions_per_block = max(1, min(length, memory_budget))
+    for row_start in range(0, len(matrix), rows_per_block):
+        block = matrix[row_start:row_start + rows_per_block]
+        distances = np.zeros(len(block), dtype=np.int64)
+        for position in range(0, length, positions_per_block):
+            distances += np.count_nonzero(block[:, position:position + positions_per_block]
+                                          != query[position:position + positions_per_block], axis=1)
+        result[row_start:row_start + rows_per_block] = distances
+    return result
+
+
+def hamming_matrix(sequences, others=None, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    All-pairs Hamming distance matrix, computed block by block.
+
+    Each block compares rows_per_block x cols_per_block pairs at once; the block
+    size is chosen so that the boolean comparison array fits in memory_budget bytes.
+
+    Args: sequences - n equal-length sequences (or an (n, length) uint8 array)
+          others - optional m sequences to compare against; defaults to sequences
+          memory_budget - bytes allowed for one block of comparisons
+
+    Returns: (n, m) distance matrix using the smallest unsigned dtype that fits
+    """
+    rows = encode_many(sequences)
+    cols = rows if others is None else encode_many(others)
+    length = rows.shape[1]
+    if cols.shape[1] != length:
+        raise ValueError(f"Sequences have length {length}, others have length {cols.shape[1]}.")
+    if memory_budget <= 0:
+        raise ValueError("memory_budget must be positive.")
+
+    n, m = len(rows), len(cols)
+    result = np.zeros((n, m), dtype=_distance_dtype(length))
+    if length == 0:
+        return result
+
+    pairs_per_block = max(1, memory_budget // length)
+    cols_per_block = min(m, pairs_per_block)
+    rows_per_block = max(1, pairs_per_block // cols_per_block)
+    for row_start in range(0, n, rows_per_block):
+        row_block = rows[row_start:row_start + rows_per_block, None, :]
+        for col_start in range(0, m, cols_per_block):
+            col_block = cols[None, col_start:col_start + cols_per_block, :]
+            result[row_start:row_start + rows_per_block, col_start:col_start + cols_per_block] = \
+                np.count_nonzero(row_block != col_block, axis=2)
+    return result
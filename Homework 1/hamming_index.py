@@ -0,0 +1,113 @@
+"""
+Hamming-radius index: find every stored sequence within distance d of a query.
+
+After hamming_distance(data[2], data[3]) the next question is usually "which of my
+reads are within d of this one?", which today means an O(N) loop over pairs.
+HammingIndex uses multi-index hashing: every sequence is cut into d + 1 segments,
+and by the pigeonhole principle any sequence within distance d of the query
+matches it exactly on at least one segment. Each segment column is kept sorted,
+so a query looks up its d + 1 segments with a binary search and only verifies
+those candidates.
+
+Example:
+    index = HammingIndex(reads, max_radius=2)
+    ids, distances = index.query("ACGTACGTAC", radius=1)
+    results = index.query_many(queries)      # list of (ids, distances), one per query
+"""
+
+import numpy as np
+
+from hamming import encode_many
+
+VERIFY_BLOCK = 1 << 16  # candidate pairs verified per NumPy call
+
+
+def _segment_bounds(length, n_segments):
+    """Split [0, length) into n_segments near-equal (start, end) ranges."""
+    edges = np.linspace(0, length, n_segments + 1).round().astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _segment_keys(rows, start, end):
+    """View each row's segment as one fixed-width byte string so it can be sorted and searched."""
+    segment = np.ascontiguousarray(rows[:, start:end])
+    return segment.view(np.dtype((np.void, end - start))).ravel()
+
+
+def _expand_ranges(low, high):
+    """For ranges [low[i], high[i]) return (owner i, position) for every position in them."""
+    counts = high - low
+    owners = np.repeat(np.arange(len(low)), counts)
+    first = np.repeat(low - (np.cumsum(counts) - counts), counts)
+    return owners, first + np.arange(counts.sum())
+
+
+class HammingIndex:
+    """
+    Multi-index hashing over a collection of equal-length sequences.
+
+    Args: sequences - equal-length sequences (str/bytes) or an (n, length) uint8 array
+          max_radius - largest query radius the index must answer exactly
+    """
+
+    def __init__(self, sequences, max_radius):
+        self.rows = encode_many(sequences)
+        self.length = self.rows.shape[1]
+        if not 0 <= max_radius < self.length:
+            raise ValueError(f"max_radius must be between 0 and {self.length - 1}.")
+        self.max_radius = max_radius
+        self.segments = _segment_bounds(self.length, max_radius + 1)
+        self._tables = []
+        for start, end in self.segments:
+            keys = _segment_keys(self.rows, start, end)
+            order = np.argsort(keys, kind="stable")
+            self._tables.append((keys[order], order))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def query(self, sequence, radius=None):
+        """
+        Every stored sequence within `radius` (default max_radius) of the query.
+
+        Returns: (ids, distances) - sorted int64 row numbers and their Hamming distances
+        """
+        return self.query_many([sequence], radius)[0]
+
+    def query_many(self, sequences, radius=None):
+        """
+        Batch radius query; segment lookups and verification are vectorized across queries.
+
+        Returns: list of (ids, distances), one pair per query, ids sorted
+        """
+        radius = self.max_radius if radius is None else radius
+        if not 0 <= radius <= self.max_radius:
+            raise ValueError(f"radius must be between 0 and max_radius ({self.max_radius}).")
+        queries = encode_many(sequences)
+        if queries.shape[1] != self.length:
+            raise ValueError(f"Queries have length {queries.shape[1]}, index holds length {self.length}.")
+
+        # Candidate (query, row) pairs from exact segment matches.
+        pair_keys = []
+        n_rows = np.int64(len(self.rows))
+        for (start, end), (sorted_keys, order) in zip(self.segments, self._tables):
+            query_keys = _segment_keys(queries, start, end)
+            low = np.searchsorted(sorted_keys, query_keys, side="left")
+            high = np.searchsorted(sorted_keys, query_keys, side="right")
+            owners, positions = _expand_ranges(low, high)
+            pair_keys.append(owners * n_rows + order[positions])
+        pairs = np.unique(np.concatenate(pair_keys))
+        query_ids, row_ids = np.divmod(pairs, n_rows)
+
+        distances = np.empty(len(pairs), dtype=np.int64)
+        for block in range(0, len(pairs), VERIFY_BLOCK):
+            rows = self.rows[row_ids[block:block + VERIFY_BLOCK]]
+            probes = queries[query_ids[block:block + VERIFY_BLOCK]]
+            distances[block:block + VERIFY_BLOCK] = np.count_nonzero(rows != probes, axis=1)
+
+        keep = distances <= radius
+        query_ids, row_ids, distances = query_ids[keep], row_ids[keep], distances[keep]
+        # Pairs are sorted by query then row, so each query's hits are one contiguous run.
+        bounds = np.searchsorted(query_ids, np.arange(len(queries) + 1))
+        return [(row_ids[bounds[i]:bounds[i + 1]], distances[bounds[i]:bounds[i + 1]])
+                for i in range(len(queries))]
@@ -0,0 +1,213 @@
+"""
+k-mer frequency tables for mRNA sequences.
+
+Counting k-mers with Python slicing (mRNA[i:i + k] for every i) allocates a new
+substring at every position. KmerCounter maps the sequence to 2-bit codes once
+and builds every k-mer code from whole arrays by doubling: the codes of all
+2m-mers are (m-mer code << 2m) | (code of the m-mer m positions later). Combining
+the blocks given by the binary digits of k takes O(log k) array passes, so no
+substrings are ever created.
+
+- k <= dense_max_k (12 by default): counts live in a dense NumPy array of 4**k
+  entries indexed by the k-mer code.
+- larger k (up to 32): counts live in a sparse table of sorted unique codes and
+  their counts; lookups are binary searches and merges are a single np.unique.
+
+Counters from different sequences are combined with merge(). count_kmers_parallel()
+spreads a list of sequences over a process pool; each task sends back only the
+(codes, counts) of the k-mers it saw, which the parent adds into one table.
+Windows containing anything other than A/C/G/T/U are skipped.
+
+Example:
+    counter = KmerCounter(3)
+    counter.add("CCACTGCACTCACCG")
+    counter["CAC"]              # 3
+    counter.most_common(2)      # [('CAC', 3), ('ACT', 2)]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from packed_sequence import code_table
+
+MAX_K = 32
+DENSE_MAX_K = 12  # 4**12 uint64 counts = 128 MiB; 4**16 would already need 32 GiB
+
+_CODE = code_table(255)  # 255 = not A/C/G/T
+
+
+def kmer_codes(sequence, k):
+    """
+    2-bit codes of every valid k-mer in the sequence.
+
+    The first base of a k-mer is the most significant, so numeric order equals
+    alphabetical order of the k-mers.
+
+    Returns: uint64 array with one code per k-mer window that holds only A/C/G/T
+    """
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}.")
+    raw = sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    codes = _CODE[np.frombuffer(raw, dtype=np.uint8)]
+    n = len(codes)
+    windows = n - k + 1
+    if windows <= 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    invalid = codes == 255
+    block = np.where(invalid, 0, codes).astype(np.uint64)  # codes of every block_length-mer
+    block_length = 1
+    hashes, length = None, 0  # codes of every length-mer built so far
+    remaining = k
+    while True:
+        if remaining & 1:
+            if hashes is None:
+                hashes, length = block, block_length
+            else:
+                count = n - length - block_length + 1
+                hashes = (hashes[:count] << np.uint64(2 * block_length)) | block[length:length + count]
+                length += block_length
+        remaining >>= 1
+        if not remaining:
+            break
+        count = n - 2 * block_length + 1
+        block = (block[:count] << np.uint64(2 * block_length)) | block[block_length:block_length + count]
+        block_length *= 2
+    hashes = hashes[:windows]
+
+    if invalid.any():
+        bad_before = np.concatenate(([0], np.cumsum(invalid)))
+        valid = bad_before[k:] == bad_before[:windows]
+        hashes = hashes[valid]
+    return hashes
+
+
+def encode_kmer(kmer):
+    """Code of a single k-mer string (same layout as kmer_codes)."""
+    codes = kmer_codes(kmer, len(kmer))
+    if len(codes) != 1:
+        raise ValueError(f"Invalid k-mer {kmer!r}.")
+    return int(codes[0])
+
+
+def decode_kmer(code, k):
+    """k-mer string for a code produced by kmer_codes."""
+    return "".join("ACGT"[(int(code) >> (2 * (k - 1 - i))) & 3] for i in range(k))
+
+
+class KmerCounter:
+    """
+    k-mer count table, dense for small k and sparse for larger k.
+
+    Args: k - k-mer length (1..32)
+          dense_max_k - largest k that uses the dense 4**k array
+    """
+
+    def __init__(self, k, dense_max_k=DENSE_MAX_K):
+        if not 0 < k <= MAX_K:
+            raise ValueError(f"k must be between 1 and {MAX_K}.")
+        self.k = k
+        self.dense = k <= dense_max_k
+        if self.dense:
+            self.table = np.zeros(4 ** k, dtype=np.uint64)
+        else:
+            self.codes = np.zeros(0, dtype=np.uint64)
+            self.counts = np.zeros(0, dtype=np.uint64)
+
+    def add(self, sequence):
+        """Count every k-mer of one more sequence. Returns self so calls can be chained."""
+        codes = kmer_codes(sequence, self.k)
+        if self.dense and len(codes) >= len(self.table) // 8:
+            self.table += np.bincount(codes.astype(np.int64), minlength=len(self.table)).astype(np.uint64)
+        elif self.dense:
+            # Short sequence: avoid a full 4**k temporary from bincount.
+            unique, counts = np.unique(codes, return_counts=True)
+            self.table[unique.astype(np.int64)] += counts.astype(np.uint64)
+        else:
+            unique, counts = np.unique(codes, return_counts=True)
+            self._merge_sparse(unique, counts.astype(np.uint64))
+        return self
+
+    def _merge_sparse(self, codes, counts):
+        all_codes = np.concatenate((self.codes, codes))
+        all_counts = np.concatenate((self.counts, counts))
+        self.codes, inverse = np.unique(all_codes, return_inverse=True)
+        self.counts = np.zeros(len(self.codes), dtype=np.uint64)
+        np.add.at(self.counts, inverse, all_counts)
+
+    def merge(self, other):
+        """Add the counts of another counter with the same k. Returns self."""
+        if other.k != self.k or other.dense != self.dense:
+            raise ValueError("Can only merge counters with the same k and layout.")
+        if self.dense:
+            self.table += other.table
+        else:
+            self._merge_sparse(other.codes, other.counts)
+        return self
+
+    def __getitem__(self, kmer):
+        if len(kmer) != self.k:
+            raise KeyError(kmer)
+        code = encode_kmer(kmer)
+        if self.dense:
+            return int(self.table[code])
+        position = np.searchsorted(self.codes, np.uint64(code))
+        if position < len(self.codes) and self.codes[position] == code:
+            return int(self.counts[position])
+        return 0
+
+    def total(self):
+        """Number of k-mer windows counted."""
+        return int(self.table.sum() if self.dense else self.counts.sum())
+
+    def items(self):
+        """(codes, counts) arrays for every k-mer seen at least once, codes ascending."""
+        if self.dense:
+            codes = np.flatnonzero(self.table).astype(np.uint64)
+            return codes, self.table[codes.astype(np.int64)]
+        return self.codes, self.counts
+
+    def to_dict(self):
+        """Dictionary - key is k-mer string, value is its count."""
+        codes, counts = self.items()
+        return {decode_kmer(code, self.k): int(count) for code, count in zip(codes, counts)}
+
+    def most_common(self, n=10):
+        """The n most frequent k-mers as (kmer, count) pairs, ties in alphabetical order."""
+        codes, counts = self.items()
+        order = np.argsort(-counts.astype(np.int64), kind="stable")[:n]
+        return [(decode_kmer(codes[i], self.k), int(counts[i])) for i in order]
+
+
+def count_kmers(sequence, k, dense_max_k=DENSE_MAX_K):
+    """Convenience wrapper: count the k-mers of a single sequence."""
+    return KmerCounter(k, dense_max_k).add(sequence)
+
+
+def _count_chunk(args):
+    """Sparse (codes, counts) of one chunk; a dense 4**k table is never pickled."""
+    sequences, k = args
+    codes = [kmer_codes(sequence, k) for sequence in sequences]
+    return np.unique(np.concatenate(codes) if codes else np.zeros(0, dtype=np.uint64), return_counts=True)
+
+
+def count_kmers_parallel(sequences, k, workers=None, chunk_size=64, dense_max_k=DENSE_MAX_K):
+    """
+    Count k-mers over many sequences with a process pool and merge the per-chunk tables.
+
+    Args: workers - worker processes (default: all CPUs)
+          chunk_size - sequences counted by one task
+
+    Returns: KmerCounter with the combined counts
+    """
+    sequences = list(sequences)
+    tasks = [(sequences[i:i + chunk_size], k) for i in range(0, len(sequences), chunk_size)]
+    total = KmerCounter(k, dense_max_k)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for codes, counts in pool.map(_count_chunk, tasks):
+            if total.dense:
+                np.add.at(total.table, codes.astype(np.int64), counts.astype(np.uint64))
+            else:
+                total._merge_sparse(codes, counts.astype(np.uint64))
+    return total
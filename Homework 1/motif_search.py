@@ -0,0 +1,165 @@
+"""
+Multi-motif search for the Homework 1 motif scan.
+
+re.finditer(motif, mRNA) only reports non-overlapping hits (AA in AAAA is found
+twice instead of three times) and has to rescan the whole sequence once per motif.
+MotifAutomaton builds an Aho-Corasick automaton once for a whole motif set and
+reports every overlapping start position of every motif in a single pass.
+
+Example:
+    automaton = MotifAutomaton(["CAG", "AA"])
+    automaton.search("CAGAAAA")   # {'CAG': array([0]), 'AA': array([3, 4, 5])}
+"""
+
+from array import array
+from collections import deque
+
+import numpy as np
+
+
+def _as_bytes(sequence):
+    """Return the sequence as bytes so it can be translated in one C-level call."""
+    if isinstance(sequence, str):
+        return sequence.encode("ascii")
+    return bytes(sequence)
+
+
+class MotifAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of motifs.
+
+    The goto/failure functions are folded into a complete transition table, so
+    the scan does exactly one table lookup per base of the sequence.
+
+    Args: motifs - iterable of non-empty motif strings (duplicates are ignored)
+    """
+
+    def __init__(self, motifs):
+        self.motifs = list(dict.fromkeys(motifs))
+        if not self.motifs:
+            raise ValueError("At least one motif is required.")
+        if any(len(motif) == 0 for motif in self.motifs):
+            raise ValueError("Motifs must be non-empty strings.")
+
+        encoded = [_as_bytes(motif) for motif in self.motifs]
+        self.lengths = np.array([len(motif) for motif in encoded], dtype=np.int64)
+
+        # Code 0 is reserved for any byte that never appears in a motif.
+        alphabet = sorted(set(b"".join(encoded)))
+        table = bytearray(256)
+        for code, byte in enumerate(alphabet, start=1):
+            table[byte] = code
+        self._table = bytes(table)
+        width = len(alphabet) + 1
+
+        # Build the trie.
+        goto = [[-1] * width]
+        output = [[]]
+        for motif_id, motif in enumerate(encoded):
+            state = 0
+            for code in motif.translate(self._table):
+                if goto[state][code] == -1:
+                    goto[state][code] = len(goto)
+                    goto.append([-1] * width)
+                    output.append([])
+                state = goto[state][code]
+            output[state].append(motif_id)
+
+        # Breadth-first pass: resolve failure links into a complete transition table.
+        fail = [0] * len(goto)
+        queue = deque()
+        for code in range(width):
+            child = goto[0][code]
+            if child == -1:
+                goto[0][code] = 0
+            else:
+                queue.append(child)
+        while queue:
+            state = queue.popleft()
+            output[state].extend(output[fail[state]])
+            for code in range(width):
+                child = goto[state][code]
+                if child == -1:
+                    goto[state][code] = goto[fail[state]][code]
+                else:
+                    fail[child] = goto[fail[state]][code]
+                    queue.append(child)
+
+        self._delta = goto
+        self._output = [tuple(ids) for ids in output]
+
+    def search_arrays(self, sequence, offset=0):
+        """
+        Scan the sequence once and return every hit as two parallel arrays.
+
+        Args: sequence - str or bytes to scan
+              offset - value added to every reported position (used when scanning chunks)
+
+        Returns: (motif_ids, starts) - int64 arrays in order of the hit end position
+        """
+        delta = self._delta
+        output = self._output
+        hit_ids = array("q")
+        hit_ends = array("q")
+        state = 0
+        for position, code in enumerate(_as_bytes(sequence).translate(self._table)):
+            state = delta[state][code]
+            if output[state]:
+                for motif_id in output[state]:
+                    hit_ids.append(motif_id)
+                    hit_ends.append(position)
+
+        motif_ids = np.frombuffer(hit_ids, dtype=np.int64) if hit_ids else np.empty(0, dtype=np.int64)
+        ends = np.frombuffer(hit_ends, dtype=np.int64) if hit_ends else np.empty(0, dtype=np.int64)
+        starts = ends - self.lengths[motif_ids] + 1 + offset
+        return motif_ids, starts
+
+    def search(self, sequence, offset=0):
+        """
+        Find every (possibly overlapping) start position of every motif.
+
+        Args: sequence - str or bytes to scan
+              offset - value added to every reported position
+
+        Returns: dictionary - key is motif, value is a sorted int64 array of start positions
+        """
+        return self.group(*self.search_arrays(sequence, offset))
+
+    def group(self, motif_ids, starts):
+        """
+        Split parallel (motif_ids, starts) arrays into one array per motif.
+
+        Returns: dictionary - key is motif, value is the int64 array of its start positions
+        """
+        order = np.argsort(motif_ids, kind="stable")
+        counts = np.bincount(motif_ids, minlength=len(self.motifs))
+        groups = np.split(starts[order], np.cumsum(counts)[:-1])
+        return {motif: group for motif, group in zip(self.motifs, groups)}
+
+    def count(self, sequence):
+        """Return an int64 array with the number of hits for each motif, in motif order."""
+        motif_ids, _ = self.search_arrays(sequence)
+        return np.bincount(motif_ids, minlength=len(self.motifs))
+
+
+def find_motif(sequence, motif):
+    """
+    Find every overlapping start position of a single motif.
+
+    For one motif str.find is already a C-level scan, so no automaton is built.
+
+    Returns: int64 array of start positions
+    """
+    if not motif:
+        raise ValueError("Motif must be a non-empty string.")
+    positions = array("q")
+    start = sequence.find(motif)
+    while start != -1:
+        positions.append(start)
+        start = sequence.find(motif, start + 1)
+    return np.frombuffer(positions, dtype=np.int64) if positions else np.empty(0, dtype=np.int64)
+
+
+def find_motifs(sequence, motifs):
+    """Convenience wrapper: build an automaton for the motifs and search the sequence once."""
+    return MotifAutomaton(motifs).search(sequence)
@@ -0,0 +1,236 @@
+"""
+2-bit packed nucleotide sequences.
+
+A Python str spends at least one byte per base and compares one character at a
+time. PackedSequence stores A/C/G/T at 2 bits per base, 32 bases per uint64 word,
+so it needs a quarter of the memory and compares 32 bases per machine word:
+Hamming distance is XOR + popcount over the words. Slicing and k-mer extraction
+shift whole words and never unpack back to characters.
+
+Base i lives in word i // 32 at bits 2 * (i % 32) and 2 * (i % 32) + 1.
+Codes: A=0, C=1, G=2, T=3 (U is read as T so mRNA strings can be packed too).
+
+Example:
+    one = PackedSequence("AGCTAG")
+    two = PackedSequence("ACTTAG")
+    one.hamming(two)          # 2
+    one[1:4].to_string()      # 'GCT'
+"""
+
+import numpy as np
+
+BASES = "ACGT"
+BASES_PER_WORD = 32
+
+_LOW_BITS = np.uint64(0x5555555555555555)
+_SHIFTS = (np.arange(BASES_PER_WORD, dtype=np.uint64) * np.uint64(2))
+
+
+def code_table(fill):
+    """
+    Byte -> base code lookup table: A/a=0, C/c=1, G/g=2, T/t/U/u=3, every other byte = fill.
+
+    Returns: uint8 array of 256 entries, for use as table[np.frombuffer(raw, dtype=np.uint8)]
+    """
+    table = np.full(256, fill, dtype=np.uint8)
+    for code, bases in enumerate(("Aa", "Cc", "Gg", "TtUu")):
+        for base in bases:
+            table[ord(base)] = code
+    return table
+
+
+_ENCODE = code_table(255)
+_DECODE = np.frombuffer(BASES.encode("ascii"), dtype=np.uint8)
+
+
+def _popcount(words):
+    """Number of set bits in each uint64 word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    return np.unpackbits(words.view(np.uint8)).reshape(len(words), 64).sum(axis=1)
+
+
+def encode_codes(sequence):
+    """
+    Map a sequence to 2-bit codes (one uint8 per base).
+
+    Raises: ValueError if the sequence contains anything other than A/C/G/T/U
+    """
+    raw = sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    codes = _ENCODE[np.frombuffer(raw, dtype=np.uint8)]
+    bad = np.flatnonzero(codes == 255)
+    if len(bad):
+        raise ValueError(f"Invalid base {chr(raw[bad[0]])!r} at position {bad[0]}.")
+    return codes
+
+
+def pack_codes(codes):
+    """Pack an array of 2-bit codes into uint64 words."""
+    n_words = -(-len(codes) // BASES_PER_WORD)
+    padded = np.zeros(n_words * BASES_PER_WORD, dtype=np.uint64)
+    padded[:len(codes)] = codes
+    return np.bitwise_or.reduce(padded.reshape(n_words, BASES_PER_WORD) << _SHIFTS, axis=1) \
+        if n_words else np.zeros(0, dtype=np.uint64)
+
+
+class PackedSequence:
+    """
+    Immutable A/C/G/T sequence stored at 2 bits per base.
+
+    Args: sequence - str or bytes of A/C/G/T (U accepted as T)
+    """
+
+    __slots__ = ("words", "length")
+
+    def __init__(self, sequence=""):
+        codes = encode_codes(sequence)
+        self.words = pack_codes(codes)
+        self.length = len(codes)
+
+    @classmethod
+    def from_words(cls, words, length):
+        """Wrap existing packed words (bits past `length` must be zero)."""
+        packed = cls.__new__(cls)
+        packed.words = words
+        packed.length = length
+        return packed
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def codes(self):
+        """Unpack to one uint8 code per base."""
+        unpacked = (self.words[:, None] >> _SHIFTS) & np.uint64(3)
+        return unpacked.reshape(-1)[:self.length].astype(np.uint8)
+
+    def to_string(self):
+        return _DECODE[self.codes()].tobytes().decode("ascii")
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        preview = self[:40].to_string() + ("..." if self.length > 40 else "")
+        return f"PackedSequence({preview!r}, length={self.length})"
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedSequence):
+            return NotImplemented
+        return self.length == other.length and np.array_equal(self.words, other.words)
+
+    def __hash__(self):
+        return hash((self.length, self.words.tobytes()))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                raise ValueError("PackedSequence slices must have step 1.")
+            return self._slice(start, max(start, stop))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("PackedSequence index out of range.")
+        return BASES[self.code_at(index)]
+
+    def code_at(self, index):
+        word, bit = divmod(index, BASES_PER_WORD)
+        return int((int(self.words[word]) >> (2 * bit)) & 3)
+
+    def _slice(self, start, stop):
+        """Shift whole words so that base `start` becomes base 0."""
+        length = stop - start
+        n_words = -(-length // BASES_PER_WORD)
+        first, bit = divmod(start, BASES_PER_WORD)
+        # One spare zero word so the high half of the last shifted word is defined.
+        source = np.append(self.words[first:first + n_words + 1], np.uint64(0))
+        if bit:
+            shift = np.uint64(2 * bit)
+            words = (source[:n_words] >> shift) | (source[1:n_words + 1] << (np.uint64(64) - shift))
+        else:
+            words = source[:n_words].copy()
+        return PackedSequence.from_words(_mask_tail(words, length), length)
+
+    def kmer(self, position, k):
+        """Return the k-mer (k <= 32) starting at `position` as an integer of 2-bit codes."""
+        if not 0 < k <= BASES_PER_WORD:
+            raise ValueError("k must be between 1 and 32.")
+        if position < 0 or position + k > self.length:
+            raise IndexError("k-mer runs past the end of the sequence.")
+        return int(self._slice(position, position + k).words[0])
+
+    def kmers(self, k):
+        """
+        All overlapping k-mers (k <= 32) as a uint64 array of 2-bit codes, read straight from the words.
+
+        Returns: array of length len(self) - k + 1 (empty if the sequence is shorter than k)
+        """
+        if not 0 < k <= BASES_PER_WORD:
+            raise ValueError("k must be between 1 and 32.")
+        count = self.length - k + 1
+        if count <= 0:
+            return np.zeros(0, dtype=np.uint64)
+        positions = np.arange(count, dtype=np.int64)
+        word_index = positions // BASES_PER_WORD
+        shift = ((positions % BASES_PER_WORD) * 2).astype(np.uint64)
+        words = np.append(self.words, np.uint64(0))
+        low = words[word_index] >> shift
+        # A shift by 64 is undefined, so the high part is only taken where shift > 0.
+        high = np.where(shift > 0, words[word_index + 1] << ((np.uint64(64) - shift) % np.uint64(64)), np.uint64(0))
+        mask = np.uint64((1 << (2 * k)) - 1) if k < BASES_PER_WORD else np.uint64(0xFFFFFFFFFFFFFFFF)
+        return (low | high) & mask
+
+    def mismatch_words(self, other):
+        """One bit set (the low bit of each 2-bit slot) for every position where the sequences differ."""
+        if self.length != other.length:
+            raise ValueError(f"Sequences must be of equal length ({self.length} != {other.length}).")
+        diff = self.words ^ other.words
+        return (diff | (diff >> np.uint64(1))) & _LOW_BITS
+
+    def hamming(self, other):
+        """Hamming distance via XOR + popcount, 32 bases per word."""
+        return int(_popcount(self.mismatch_words(other)).sum())
+
+
+def _mask_tail(words, length):
+    """Clear the bits past `length` in the last word so equal sequences have equal words."""
+    tail = length % BASES_PER_WORD
+    if tail and len(words):
+        words[-1] &= np.uint64((1 << (2 * tail)) - 1)
+    return words
+
+
+def decode_kmer(value, k):
+    """Turn an integer k-mer code back into a string."""
+    return "".join(BASES[(value >> (2 * i)) & 3] for i in range(k))
+
+
+def count_mismatches(words_one, words_two):
+    """
+    Number of differing bases between packed words, element by element.
+
+    Both arguments are uint64 arrays of the same (broadcastable) shape; each word
+    holds up to 32 bases and the result has the broadcast shape.
+    """
+    diff = np.bitwise_xor(words_one, words_two)
+    diff = (diff | (diff >> np.uint64(1))) & _LOW_BITS
+    return _popcount(diff.reshape(-1)).reshape(diff.shape).astype(np.int64)
+
+
+def hamming_many(query, sequences):
+    """
+    Hamming distance from one packed query to many packed sequences of the same length.
+
+    Returns: int64 array of distances, one per sequence
+    """
+    if not sequences:
+        return np.zeros(0, dtype=np.int64)
+    for sequence in sequences:
+        if sequence.length != query.length:
+            raise ValueError(f"Sequences must be of equal length ({query.length} != {sequence.length}).")
+    stacked = np.vstack([sequence.words for sequence in sequences])
+    return count_mismatches(stacked, query.words).sum(axis=1)
@@ -0,0 +1,129 @@
+"""
+Position weight matrix (PWM) scanning.
+
+Exact motif strings, as used in hw1short.ipynb, miss binding sites that differ by
+a base or two. A PWM gives every base at every motif position a log-odds score;
+a window's score is the sum of its per-position scores. Scores are computed one
+motif column at a time over all window starts (and all PWMs) at once, so the
+only Python loop runs over motif columns, never over sequence positions.
+
+PWMs are (4, width) arrays with rows in A, C, G, T order. Windows that contain
+any other character score -inf.
+
+Example:
+    pwm = log_odds(counts)                      # counts: (4, width) observed base counts
+    hits = scan(mRNA, pwm, threshold=5.0)       # structured array of hits
+    hits = scan_many([mRNA, other], [pwm_one, pwm_two], threshold=[5.0, 7.5], both_strands=True)
+"""
+
+import numpy as np
+
+from hamming import encode
+from packed_sequence import code_table
+
+BLOCK_CELLS = 1 << 24  # PWMs x window starts scored per block
+
+HIT_DTYPE = np.dtype([("pwm", np.int32), ("sequence", np.int64), ("position", np.int64),
+                      ("strand", np.int8), ("score", np.float64)])
+
+_CODE = code_table(4)  # 4 = not A/C/G/T
+
+
+def log_odds(counts, background=(0.25, 0.25, 0.25, 0.25), pseudocount=0.5):
+    """
+    Build a log2-odds PWM from a (4, width) matrix of observed base counts.
+
+    Returns: (4, width) float64 array
+    """
+    counts = np.asarray(counts, dtype=np.float64) + pseudocount
+    if counts.ndim != 2 or counts.shape[0] != 4:
+        raise ValueError(f"Expected a (4, width) count matrix, got shape {counts.shape}.")
+    frequencies = counts / counts.sum(axis=0)
+    return np.log2(frequencies / np.asarray(background, dtype=np.float64)[:, None])
+
+
+def reverse_complement_pwm(pwm):
+    """PWM for the opposite strand: reverse the columns and swap A<->T, C<->G (reverse the rows)."""
+    return np.asarray(pwm)[::-1, ::-1]
+
+
+def _stack(pwms):
+    """
+    Pad PWMs to a common width as (P, 5, width) tables indexed by base code.
+
+    Code 4 (not A/C/G/T) scores -inf in real columns; padding columns score 0 for every code.
+    """
+    widths = np.array([pwm.shape[1] for pwm in pwms])
+    stacked = np.zeros((len(pwms), 5, int(widths.max())), dtype=np.float64)
+    for number, pwm in enumerate(pwms):
+        stacked[number, :4, :pwm.shape[1]] = pwm
+        stacked[number, 4, :pwm.shape[1]] = -np.inf
+    return stacked, widths
+
+
+def score_windows(sequence, pwms):
+    """
+    Score every window of the sequence against every PWM.
+
+    Returns: (P, n) float64 array; entry [p, s] is the score of the window starting at s,
+             -inf where the window runs past the end or contains a non-ACGT base
+    """
+    pwms = [np.asarray(pwm, dtype=np.float64) for pwm in pwms]
+    for pwm in pwms:
+        if pwm.ndim != 2 or pwm.shape[0] != 4:
+            raise ValueError(f"Expected (4, width) PWMs, got shape {pwm.shape}.")
+    stacked, widths = _stack(pwms)
+    width = stacked.shape[2]
+    n = len(sequence)
+    # Pad with code 4 so windows past the end pick up -inf from their real columns.
+    codes = np.full(n + width, 4, dtype=np.uint8)
+    codes[:n] = _CODE[encode(sequence)]
+
+    scores = np.empty((len(pwms), n), dtype=np.float64)
+    block = max(1, BLOCK_CELLS // len(pwms))
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        total = np.zeros((len(pwms), stop - start), dtype=np.float64)
+        for column in range(width):
+            total += stacked[:, codes[start + column:stop + column], column]
+        scores[:, start:stop] = total
+    return scores
+
+
+def scan_many(sequences, pwms, threshold, both_strands=False):
+    """
+    Report every window scoring at least the threshold, for every PWM and sequence.
+
+    Args: sequences - iterable of str/bytes
+          pwms - list of (4, width) log-odds matrices
+          threshold - one score for all PWMs, or one per PWM
+          both_strands - also scan the reverse complement (strand -1, position of the forward window)
+
+    Returns: structured array with fields pwm, sequence, position, strand, score
+    """
+    pwms = [np.asarray(pwm, dtype=np.float64) for pwm in pwms]
+    if not pwms:
+        raise ValueError("At least one PWM is required.")
+    thresholds = np.broadcast_to(np.asarray(threshold, dtype=np.float64), (len(pwms),))
+    strands = [(1, pwms)]
+    if both_strands:
+        strands.append((-1, [reverse_complement_pwm(pwm) for pwm in pwms]))
+
+    hits = []
+    for sequence_number, sequence in enumerate(sequences):
+        for strand, strand_pwms in strands:
+            scores = score_windows(sequence, strand_pwms)
+            pwm_ids, positions = np.nonzero(scores >= thresholds[:, None])
+            found = np.empty(len(positions), dtype=HIT_DTYPE)
+            found["pwm"] = pwm_ids
+            found["sequence"] = sequence_number
+            found["position"] = positions
+            found["strand"] = strand
+            found["score"] = scores[pwm_ids, positions]
+            hits.append(found)
+    return np.concatenate(hits) if hits else np.empty(0, dtype=HIT_DTYPE)
+
+
+def scan(sequence, pwm, threshold, both_strands=False):
+    """Convenience wrapper: hits of one PWM in one sequence."""
+    return scan_many([sequence], [pwm], threshold, both_strands)
@@ -0,0 +1,161 @@
+"""
+Streaming reader for HW1-format sequence files.
+
+HW1shortData.txt holds one sequence per line: the mRNA, the motif and the two
+strings compared by hamming_distance. Reading it with file.readlines() keeps the
+whole file in memory as Python strings, which breaks down once the mRNA line is
+chromosome sized. SequenceFile memory-maps the file instead and hands out
+fixed-size chunks of a line, so peak memory depends on the chunk size and not on
+the file size. The line index is an int64 array of newline offsets, found with
+vectorized searches over fixed-size blocks of the map (8 bytes per line).
+
+Example:
+    with SequenceFile("HW1shortData.txt") as seq_file:
+        motif = seq_file.line(1).decode()
+        for offset, chunk in seq_file.iter_chunks(0, chunk_size=1 << 20, overlap=len(motif) - 1):
+            ...
+"""
+
+import mmap
+
+import numpy as np
+
+from motif_search import MotifAutomaton
+
+INDEX_BLOCK_SIZE = 1 << 22  # bytes searched for newlines per vectorized pass
+
+
+class SequenceFile:
+    """
+    Memory-mapped view of a file with one sequence per line.
+
+    Args: fileName - path to the sequence file
+    """
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self._file = open(fileName, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files; an empty bytes object behaves the same way here.
+            self._map = b""
+        self._newlines = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.newlines()) + (1 if self._has_unterminated_line() else 0)
+
+    def newlines(self):
+        """
+        Return an int64 array with the byte offset of every newline in the file.
+
+        The map is searched in blocks of INDEX_BLOCK_SIZE bytes, so no line is copied
+        into memory and the temporary arrays do not grow with the file.
+        """
+        if self._newlines is None:
+            data = np.frombuffer(self._map, dtype=np.uint8)
+            found = [np.flatnonzero(data[start:start + INDEX_BLOCK_SIZE] == 10) + start
+                     for start in range(0, len(data), INDEX_BLOCK_SIZE)]
+            self._newlines = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+        return self._newlines
+
+    def _has_unterminated_line(self):
+        newlines = self.newlines()
+        last_end = int(newlines[-1]) + 1 if len(newlines) else 0
+        return last_end < len(self._map)
+
+    def span(self, index):
+        """Return the (start, end) byte offsets of one line, without the line terminator."""
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError(f"Line {index} out of range for a file of {count} lines.")
+        index %= count
+        newlines = self.newlines()
+        start = int(newlines[index - 1]) + 1 if index else 0
+        end = int(newlines[index]) if index < len(newlines) else len(self._map)
+        if end > start and self._map[end - 1:end] == b"\r":
+            end -= 1
+        return start, end
+
+    def line_spans(self):
+        """
+        Return an (n, 2) int64 array of (start, end) byte offsets, one row per line,
+        without the line terminator. Prefer span(index) when only a few lines are needed.
+        """
+        newlines = self.newlines()
+        ends = newlines
+        if self._has_unterminated_line():
+            ends = np.append(newlines, len(self._map))
+        starts = np.concatenate(([0], newlines + 1))[:len(ends)]
+        data = np.frombuffer(self._map, dtype=np.uint8)
+        carriage = (ends > starts) & (data[np.maximum(ends - 1, 0)] == 13) if len(data) else ends > starts
+        return np.column_stack((starts, ends - carriage))
+
+    def line_length(self, index):
+        start, end = self.span(index)
+        return end - start
+
+    def line(self, index):
+        """Return a whole line as bytes. Only use this for short lines such as the motif."""
+        start, end = self.span(index)
+        return self._map[start:end]
+
+    def iter_chunks(self, index=0, chunk_size=1 << 20, overlap=0):
+        """
+        Yield a line in fixed-size pieces that overlap by `overlap` bytes.
+
+        Each chunk covers [offset, offset + chunk_size + overlap) of the line, so a
+        motif of length up to overlap + 1 that starts inside [offset, offset + chunk_size)
+        is always complete within that chunk.
+
+        Args: index - line number to read (0 is the mRNA line)
+              chunk_size - number of new bytes per chunk
+              overlap - number of bytes repeated from the start of the next chunk
+
+        Returns: generator of (offset, chunk) where offset is the position of chunk[0] in the line
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        if overlap < 0:
+            raise ValueError("overlap must not be negative.")
+        start, end = self.span(index)
+        for chunk_start in range(start, end, chunk_size):
+            chunk_end = min(chunk_start + chunk_size + overlap, end)
+            yield chunk_start - start, self._map[chunk_start:chunk_end]
+
+
+def scan_motifs(fileName, motifs, index=0, chunk_size=1 << 20):
+    """
+    Find every overlapping occurrence of each motif in one line of a large file.
+
+    The line is streamed in chunks that overlap by (longest motif - 1) bytes. A hit
+    is kept only by the chunk it starts in, so hits across chunk boundaries are found
+    exactly once.
+
+    Returns: dictionary - key is motif, value is a sorted int64 array of start positions
+    """
+    automaton = MotifAutomaton(motifs)
+    overlap = int(automaton.lengths.max()) - 1
+    found_ids = []
+    found_starts = []
+    with SequenceFile(fileName) as seq_file:
+        for offset, chunk in seq_file.iter_chunks(index, chunk_size, overlap):
+            motif_ids, starts = automaton.search_arrays(chunk, offset)
+            keep = starts < offset + chunk_size
+            found_ids.append(motif_ids[keep])
+            found_starts.append(starts[keep])
+
+    motif_ids = np.concatenate(found_ids) if found_ids else np.empty(0, dtype=np.int64)
+    starts = np.concatenate(found_starts) if found_starts else np.empty(0, dtype=np.int64)
+    return automaton.group(motif_ids, starts)
@@ -0,0 +1,232 @@
+"""
+Block-compressed sequence store with random access.
+
+Files in the HW1shortData.txt layout hold one sequence per line, so fetching the
+i-th record means reading the file from the start. A sequence store instead
+concatenates all records into one stream, cuts the stream into fixed-size blocks,
+compresses each block independently with zlib and appends an offset index. Reading
+record i, or bases [a, b) of record i, decompresses only the blocks it touches.
+
+File layout:
+    compressed blocks | record starts (uint64, n + 1) | block offsets (uint64, blocks + 1) | trailer
+
+Usage:
+    python sequence_store.py convert HW1shortData.txt records.seqz
+    python sequence_store.py get records.seqz 0 44 47        # bases [44, 47) of record 0
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+
+import numpy as np
+
+MAGIC = b"SEQZ0001"
+_TRAILER = struct.Struct("<8sQQQQ")  # magic, block size, records, blocks, index offset
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+class SequenceStoreWriter:
+    """
+    Streaming writer; records are appended with add() or add_chunks().
+
+    Args: fileName - output path
+          block_size - uncompressed bytes per independently compressed block
+          level - zlib compression level
+    """
+
+    def __init__(self, fileName, block_size=DEFAULT_BLOCK_SIZE, level=6):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive.")
+        self.block_size = block_size
+        self.level = level
+        self._file = open(fileName, "wb")
+        self._buffer = bytearray()
+        self._record_starts = array("Q", [0])
+        self._block_offsets = array("Q", [0])
+        self._position = 0  # bytes of the uncompressed stream written so far
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+    def _write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self.block_size:
+            self._flush_block(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+
+    def _flush_block(self, block):
+        compressed = zlib.compress(bytes(block), self.level)
+        self._file.write(compressed)
+        self._block_offsets.append(self._block_offsets[-1] + len(compressed))
+
+    def add(self, sequence):
+        """Append one record."""
+        self.add_chunks([sequence])
+
+    def add_chunks(self, chunks):
+        """Append one record given as an iterable of str/bytes pieces (for sequences too large for memory)."""
+        for chunk in chunks:
+            self.write(chunk)
+        self.end_record()
+
+    def write(self, chunk):
+        """Append a str/bytes piece to the current record; end_record() closes the record."""
+        self._write(chunk.encode("ascii") if isinstance(chunk, str) else chunk)
+
+    def end_record(self):
+        self._record_starts.append(self._position)
+
+    def end_records(self, pieces):
+        """Append pieces (bytes) to the stream, ending one record after each of them."""
+        ends = np.cumsum([len(piece) for piece in pieces], dtype=np.uint64) + np.uint64(self._position)
+        self._write(b"".join(pieces))
+        self._record_starts.extend(ends.tolist())
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._buffer:
+            self._flush_block(self._buffer)
+            self._buffer = bytearray()
+        index_offset = self._block_offsets[-1]
+        self._file.write(self._record_starts.tobytes())
+        self._file.write(self._block_offsets.tobytes())
+        self._file.write(_TRAILER.pack(MAGIC, self.block_size, len(self._record_starts) - 1,
+                                       len(self._block_offsets) - 1, index_offset))
+        self._file.close()
+
+
+class SequenceStore:
+    """
+    Random-access reader for a sequence store file (memory-mapped).
+
+    Args: fileName - path written by SequenceStoreWriter or convert_text()
+    """
+
+    def __init__(self, fileName):
+        self._file = open(fileName, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _TRAILER.size:
+            raise ValueError(f"{fileName} is not a sequence store.")
+        magic, self.block_size, n_records, n_blocks, index_offset = \
+            _TRAILER.unpack_from(self._map, len(self._map) - _TRAILER.size)
+        if magic != MAGIC:
+            raise ValueError(f"{fileName} is not a sequence store.")
+        self.record_starts = np.frombuffer(self._map, dtype=np.uint64, count=n_records + 1, offset=index_offset)
+        self.block_offsets = np.frombuffer(self._map, dtype=np.uint64, count=n_blocks + 1,
+                                           offset=index_offset + 8 * (n_records + 1))
+        self._cached_block = (-1, b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # Drop the views into the map before closing it.
+        self.record_starts = self.block_offsets = None
+        self._map.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.record_starts) - 1
+
+    def record_length(self, index):
+        return int(self.record_starts[index + 1] - self.record_starts[index])
+
+    def _block(self, number):
+        """Decompressed block, with the most recent one cached for sequential reads."""
+        if self._cached_block[0] != number:
+            start, end = int(self.block_offsets[number]), int(self.block_offsets[number + 1])
+            self._cached_block = (number, zlib.decompress(self._map[start:end]))
+        return self._cached_block[1]
+
+    def _read_stream(self, start, end):
+        """Bytes [start, end) of the uncompressed stream, touching only the blocks that hold them."""
+        pieces = []
+        for number in range(start // self.block_size, (end - 1) // self.block_size + 1):
+            block = self._block(number)
+            block_start = number * self.block_size
+            pieces.append(block[max(start - block_start, 0):end - block_start])
+        return b"".join(pieces)
+
+    def get(self, index, start=None, end=None):
+        """
+        Record `index`, or its subsequence [start, end), as a str.
+
+        start/end follow slice rules (None means the record boundary; negative values count from the end).
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("record index out of range")
+        index %= len(self)
+        record_start = int(self.record_starts[index])
+        first, last, _ = slice(start, end).indices(self.record_length(index))
+        if last <= first:
+            return ""
+        return self._read_stream(record_start + first, record_start + last).decode("ascii")
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+
+def convert_text(text_file, store_file, block_size=DEFAULT_BLOCK_SIZE, chunk_size=1 << 20):
+    """
+    Convert a one-sequence-per-line text file (HW1 layout) into a sequence store.
+
+    The file is read once, in order, chunk_size bytes at a time, and a record ends at
+    every newline, so neither a line nor a per-line index has to fit in memory.
+    A carriage return before the newline is dropped, as in SequenceFile.
+
+    Returns: number of records written
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    count = 0
+    with open(text_file, "rb") as source, SequenceStoreWriter(store_file, block_size) as writer:
+        carry = b""  # a trailing b"\r" held back until we know whether a newline follows
+        partial = False  # bytes of an unterminated record have been written
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            lines = (carry + chunk).split(b"\n")
+            writer.end_records([line[:-1] if line.endswith(b"\r") else line for line in lines[:-1]])
+            count += len(lines) - 1
+            tail = lines[-1]
+            carry = b"\r" if tail.endswith(b"\r") else b""
+            writer.write(tail[:len(tail) - len(carry)])
+            partial = (partial and len(lines) == 1) or bool(tail)
+        if partial or carry:
+            writer.end_record()  # last line without a newline
+            count += 1
+        return count
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 3 and argv[0] == "convert":
+        count = convert_text(argv[1], argv[2])
+        print(f"Wrote {count} records to {argv[2]}")
+    elif len(argv) in (3, 5) and argv[0] == "get":
+        with SequenceStore(argv[1]) as store:
+            bounds = [int(value) for value in argv[3:]] or [None, None]
+            print(store.get(int(argv[2]), *bounds))
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
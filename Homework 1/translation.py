@@ -0,0 +1,128 @@
+"""
+Codon translation and six-frame ORF scan for mRNA lines.
+
+The sequence is mapped to 2-bit codes once (A=0, C=1, G=2, T/U=3). Every codon
+then has an index 16 * first + 4 * second + third, and a 64-entry NumPy table
+turns codon indices into amino acids, so translation never loops per codon in
+Python. The ORF scan computes the codon index at every position of both strands
+in one pass; frames are just the positions modulo 3.
+
+Example:
+    translate("AUGGCCUAA")          # 'MA*'
+    orfs = find_orfs(mRNA, min_codons=30)
+    orfs["strand"], orfs["start"], orfs["end"]
+"""
+
+import numpy as np
+
+from packed_sequence import encode_codes
+
+# Standard genetic code indexed by 16 * first + 4 * second + third base (A=0, C=1, G=2, T=3): AAA ... TTT.
+_AMINO_ACIDS = (
+    "KNKNTTTTRSRSIIMI"   # A??
+    "QHQHPPPPRRRRLLLL"   # C??
+    "EDEDAAAAGGGGVVVV"   # G??
+    "*Y*YSSSS*CWCLFLF"   # T??
+)
+CODON_TABLE = np.frombuffer(_AMINO_ACIDS.encode("ascii"), dtype=np.uint8)
+START_CODON = 14                  # ATG
+STOP_CODONS = (48, 50, 56)        # TAA, TAG, TGA
+
+ORF_DTYPE = np.dtype([("strand", np.int8), ("frame", np.int8), ("start", np.int64),
+                      ("end", np.int64), ("codons", np.int64)])
+
+
+def codon_indices(codes):
+    """Codon index (0..63) starting at every position of a 2-bit code array."""
+    if len(codes) < 3:
+        return np.zeros(0, dtype=np.uint8)
+    return (codes[:-2] << 4) | (codes[1:-1] << 2) | codes[2:]
+
+
+def reverse_complement_codes(codes):
+    """2-bit codes of the reverse complement (A<->T and C<->G are 3 - code)."""
+    return (3 - codes[::-1]).astype(np.uint8)
+
+
+def translate(sequence, frame=0, reverse=False):
+    """
+    Translate one reading frame to a protein string ('*' marks stop codons).
+
+    Args: frame - 0, 1 or 2; reverse - translate the reverse complement instead
+    """
+    if frame not in (0, 1, 2):
+        raise ValueError("frame must be 0, 1 or 2.")
+    codes = encode_codes(sequence)
+    if reverse:
+        codes = reverse_complement_codes(codes)
+    usable = (len(codes) - frame) // 3 * 3
+    triplets = codes[frame:frame + usable].reshape(-1, 3)
+    indices = (triplets[:, 0] << 4) | (triplets[:, 1] << 2) | triplets[:, 2]
+    return CODON_TABLE[indices].tobytes().decode("ascii")
+
+
+def six_frame_translation(sequence):
+    """Dictionary - key is (strand, frame) with strand +1/-1, value is the protein string."""
+    return {(strand, frame): translate(sequence, frame, reverse=strand < 0)
+            for strand in (1, -1) for frame in (0, 1, 2)}
+
+
+def _strand_orfs(indices, min_codons, nested):
+    """ORFs on one strand as (frame, start, end) arrays, coordinates on that strand."""
+    positions = np.arange(len(indices))
+    starts = positions[indices == START_CODON]
+    stops = positions[np.isin(indices, STOP_CODONS)]
+
+    frames, orf_starts, orf_ends = [], [], []
+    for frame in range(3):
+        frame_starts = starts[starts % 3 == frame]
+        frame_stops = stops[stops % 3 == frame]
+        following = np.searchsorted(frame_stops, frame_starts)
+        has_stop = following < len(frame_stops)
+        frame_starts, following = frame_starts[has_stop], following[has_stop]
+        if not nested:
+            # Keep only the first ATG before each stop, i.e. the longest ORF.
+            _, first = np.unique(following, return_index=True)
+            frame_starts, following = frame_starts[first], following[first]
+        ends = frame_stops[following] + 3
+        frames.append(np.full(len(frame_starts), frame))
+        orf_starts.append(frame_starts)
+        orf_ends.append(ends)
+
+    frames, orf_starts, orf_ends = np.concatenate(frames), np.concatenate(orf_starts), np.concatenate(orf_ends)
+    long_enough = (orf_ends - orf_starts) // 3 - 1 >= min_codons
+    return frames[long_enough], orf_starts[long_enough], orf_ends[long_enough]
+
+
+def find_orfs(sequence, min_codons=30, nested=False):
+    """
+    Open reading frames (ATG ... stop) in all six frames.
+
+    Args: min_codons - minimum ORF length in codons, not counting the stop codon
+          nested - also report ORFs that start at a later ATG inside a longer ORF
+
+    Returns: structured array with fields strand (+1/-1), frame, start, end (forward-strand
+             coordinates, end exclusive and including the stop codon) and codons, sorted by start
+    """
+    codes = encode_codes(sequence)
+    n = len(codes)
+    pieces = []
+    for strand, strand_codes in ((1, codes), (-1, reverse_complement_codes(codes))):
+        frames, starts, ends = _strand_orfs(codon_indices(strand_codes), min_codons, nested)
+        orfs = np.empty(len(starts), dtype=ORF_DTYPE)
+        orfs["strand"] = strand
+        orfs["frame"] = frames
+        if strand > 0:
+            orfs["start"], orfs["end"] = starts, ends
+        else:
+            orfs["start"], orfs["end"] = n - ends, n - starts
+        orfs["codons"] = (ends - starts) // 3 - 1
+        pieces.append(orfs)
+    result = np.concatenate(pieces)
+    return result[np.argsort(result["start"], kind="stable")]
+
+
+def orf_protein(sequence, orf):
+    """Protein string of one row returned by find_orfs (without the trailing '*')."""
+    region = sequence[int(orf["start"]):int(orf["end"])]
+    return translate(region, 0, reverse=orf["strand"] < 0)[:-1]
@@ -7,25 +7,24 @@
 
 #atomCount (compound) returns a dictionary – key is atom, and value is # atoms. 
 #	Example: atomCount (‘Fe(OH)3’) returns {'H': 3, 'Fe': 1, 'O': 3} 
+#	atomCount is a single-pass parser (parseFormula): nested ()/[]/{} groups and hydrates such as CuSO4·5H2O are supported
 #splitOnAtomCount (compound) returns a list in order of appearance: stuff, atom count, etc. 
 #	Example: splitOnAtomCount ('Hg3(PO4)2') returns ['Hg', '3', '(PO', '4', ')', '2']
 
 
 #symbolAndMassses (peirodicTableFileName) returns a dictionary – key is atom, and value is mass, for all elements in the file. 
-#	Example: symbolAndMassses (‘PeriodicTableData.xlsx’) returns {'H': '1.008', 'He': '4.003' …}
+#	Example: symbolAndMassses (‘PeriodicTableData.xlsx’) returns {'H': 1.008, 'He': 4.003 …} (masses are floats)
 
 
-import xlrd
 import re
 
 def symbolAndMasses (fileName):
     
-    workbook = xlrd.open_workbook(fileName)
-    sheet = workbook.sheet_by_index(0)
-    symbolName = sheet.col_values(1, 1)
-    mass = sheet.col_values(6, 1)
-
-    symbolMassDict = {s : m for s, m in zip(symbolName, mass)}
+    #The workbook is compiled once into a JSON cache next to it (see periodic_table.py),
+    #so xlrd is only imported when the cache is missing or the workbook has changed.
+    #periodic_table (and NumPy with it) is imported here, on first use, so importing Chemistry stays cheap.
+    from periodic_table import getPeriodicTable
+    symbolMassDict = getPeriodicTable(fileName).asDict()
     return (symbolMassDict)
 
 def unParen(compound):
@@ -41,33 +40,85 @@ def unParen(compound):
         text = match[1] * count
         compound = compound.replace('(' + match[1] + ')' + match[3], text)
         #print ("now", compound) 
-     
-def atomCount(compound):
-
-  #return: dictionary - key is atom, value is # atoms
 
-  #Modified from Lpez web resource ... stackoverflow.com/questions/16699180 ...
-  import re
+#Every element symbol, in atomic-number order (same list as PeriodicTableData.xls)
+ELEMENTS = frozenset("""
+H He Li Be B C N O F Ne Na Mg Al Si P S Cl Ar K Ca Sc Ti V Cr Mn Fe Co Ni Cu Zn Ga Ge
+As Se Br Kr Rb Sr Y Zr Nb Mo Tc Ru Rh Pd Ag Cd In Sn Sb Te I Xe Cs Ba La Ce Pr Nd Pm Sm
+Eu Gd Tb Dy Ho Er Tm Yb Lu Hf Ta W Re Os Ir Pt Au Hg Tl Pb Bi Po At Rn Fr Ra Ac Th Pa U
+Np Pu Am Cm Bk Cf Es Fm Md No Lr Rf Db Sg Bh Hs Mt Ds Rg Cn Nh Fl Mc Lv Ts Og
+""".split())
 
-  atomDict = {}
+OPEN_GROUP = {"(": ")", "[": "]", "{": "}"}
+HYDRATE_DOTS = "·•∙.*"
 
-  #unParentisize the given compound
-  compoundNoParen = unParen(compound)
+def parseFormula(compound):
+  #return: dictionary - key is atom, value is # atoms
+  #
+  #Single left-to-right pass with a stack of partial counts, so groups are multiplied
+  #instead of being expanded as text: (C6H12O6)100 costs the same as C6H12O6.
+  #Supports nested (), [] and {} groups and hydrate dots: CuSO4·5H2O, CuSO4.5H2O.
+  #A leading stoichiometric coefficient (the 3 in 3Hg(OH)2) is skipped, as before;
+  #molesAndCompounds reads it.
+  text = compound.strip()
+  length = len(text)
+
+  def readNumber(position):
+    start = position
+    while position < length and text[position].isdigit():
+      position += 1
+    return (int(text[start:position]) if position > start else 1), position
+
+  _, i = readNumber(0)             #skip the stoichiometric coefficient
+  total = {}
+  segmentMultiplier = 1            #hydrate coefficient of the current "·" segment
+  stack = [({}, None)]             #(counts, expected closing bracket)
+
+  while i < length:
+    c = text[i]
+    if c.isupper():
+      j = i + 1
+      while j < length and text[j].islower():
+        j += 1
+      atom = text[i:j]
+      if atom not in ELEMENTS:
+        raise ValueError(f"Unknown element '{atom}' in {compound}")
+      count, i = readNumber(j)
+      counts = stack[-1][0]
+      counts[atom] = counts.get(atom, 0) + count
+    elif c in OPEN_GROUP:
+      stack.append(({}, OPEN_GROUP[c]))
+      i += 1
+    elif c in ")]}":
+      group, closing = stack.pop() if len(stack) > 1 else ({}, None)
+      if c != closing:
+        raise ValueError(f"Unbalanced '{c}' in {compound}")
+      count, i = readNumber(i + 1)
+      counts = stack[-1][0]
+      for atom, n in group.items():
+        counts[atom] = counts.get(atom, 0) + n * count
+    elif c in HYDRATE_DOTS:
+      if len(stack) > 1:
+        raise ValueError(f"Hydrate dot inside a group in {compound}")
+      for atom, n in stack[0][0].items():
+        total[atom] = total.get(atom, 0) + n * segmentMultiplier
+      stack = [({}, None)]
+      segmentMultiplier, i = readNumber(i + 1)
+    elif c.isspace():
+      i += 1
+    else:
+      raise ValueError(f"Unexpected character '{c}' in {compound}")
 
-  myRegEx = re.compile("(C[laroudsemf]?|Os?|N[eaibdpos]?|S[icernbmg]?|P[drmtboau]?|H[eofgas]?|A[lrsgutcm]|B[eraik]?|Dy|E[urs]|F[erm]?|G[aed]|I[nr]?|Kr?|L[iaur]|M[gnodt]|R[buhenaf]|T[icebmalh]|U|V|W|Xe|Yb?|Z[nr])(\d*)")
+  if len(stack) > 1:
+    raise ValueError(f"Missing '{stack[-1][1]}' in {compound}")
+  for atom, n in stack[0][0].items():
+    total[atom] = total.get(atom, 0) + n * segmentMultiplier
+  return (total)
 
-  #create dictionary with key as atom, and value as # how many of this atom
-  myMatches = myRegEx.findall(compoundNoParen)
-  for match in myMatches:
-    #Search atom
-    atom = match[0]
-    value = 1 if match[1]=="" else int(match[1])
-    #print(atom,value)
-    atomDict.setdefault(atom,0)
-    atomDict [atom] += value
+def atomCount(compound):
 
-  #print (atomDict)
-  return (atomDict)
+  #return: dictionary - key is atom, value is # atoms
+  return (parseFormula(compound))
 
 def splitOnAtomCount (compound):
   myCompound = compound
@@ -1,33 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
-from Chemistry import molesAndCompounds, atomCount, splitOnAtomCount, symbolAndMasses, numberAsSubscript
+from Chemistry import splitOnAtomCount, numberAsSubscript
 
-# Read the equation from file
-with open("/Users/ika/Desktop/Spring_2025/CS5630/python_comput_data_science/Homework 2/Homework 2 short sample input.txt", "r") as file:
-    equation = file.readline().strip()
-
-# Parse equation dynamically
-reactants, products = equation.split("=")
-reactants = [r.strip() for r in reactants.split("+")]
-products = [p.strip() for p in products.split("+")]
-
-# Include separators but replace "|" with an empty string
-compounds = reactants + [""] + ["="] + products  
-
-# Ensure UI supports at least 6 columns
-while len(compounds) < 6:
-    compounds.append("")
-
-# Get atomic masses from periodic table data
-periodic_data = symbolAndMasses("/Users/ika/Desktop/Spring_2025/CS5630/python_comput_data_science/Homework 2/PeriodicTableData.xls")
-
-# Compute molar masses safely
-def get_molar_mass(compound):
-    atoms = atomCount(compound)
-    return sum(float(periodic_data[element]) * int(count) for element, count in atoms.items())
-
-# Store molar masses
-molar_masses = {compound: get_molar_mass(compound) for compound in compounds if compound not in ["", "="]}
 
 # Convert formulas to display subscripts properly
 def transform_to_subscript(compound):
@@ -39,130 +13,116 @@ def transform_to_subscript(compound):
         transformed += f"{numberAsSubscript(part)}" if (part.isdigit() and parts.index(part) != 0) else part
     return transformed
 
-# GUI Setup
-root = tk.Tk()
-root.title("Stoichiometry Calculator")
-
-# Display equation
-tk.Label(root, text=equation).grid(row=0, column=0, columnspan=6, pady=10)
-
-# First Row: Chemical Names
-for i, compound in enumerate(compounds):
-    tk.Entry(root, justify="center", width=10, state="readonly",
-             readonlybackground="white", fg="black").grid(row=1, column=i, padx=5, pady=5)
-    tk.Label(root, text=compound).grid(row=1, column=i, padx=5, pady=5)
-
-# Second Row: Transformed Subscripts
-for i, compound in enumerate(compounds):
-    transformed = transform_to_subscript(compound)
-    tk.Entry(root, justify="center", width=10, state="readonly",
-             readonlybackground="white", fg="black").grid(row=2, column=i, padx=5, pady=5)
-    tk.Label(root, text=transformed).grid(row=2, column=i, padx=5, pady=5)
-
-# Third Row: User Inputs & Computed Values
-entries = []
-for i, compound in enumerate(compounds):
-    entry = tk.Entry(root, justify="center")
-    entry.grid(row=3, column=i, padx=5, pady=5)
-    entries.append(entry)
-
-# Label for user input cell
-input_label = tk.Label(root, text="Input Cell", fg="gray", font=("Arial", 10, "italic"))
-input_label.grid(row=4, column=1, pady=2)
-
-# Checkbox for Moles/Grams
-checkbox_var = tk.BooleanVar()
-checkbox = tk.Checkbutton(root, text="Moles?", variable=checkbox_var)
-checkbox.grid(row=4, column=2, padx=5, pady=5)
-
-# **Explicitly store which reactant was entered by the user**
-user_input_storage = {}
-user_selected_input = None  # Track which reactant was entered
-
-# Compute Stoichiometry while keeping the correct input cell unchanged
-def compute_stoichiometry():
-    try:
-        global user_selected_input  
-        is_moles = checkbox_var.get()
-
-        # Identify the reactant where the user entered a value
-        user_input_reactant = None
-        user_input_value = None
-        user_input_index = None
-
-        for i, reactant in enumerate(reactants):
-            value = entries[i].get().strip()
-            if value:  # User input found
-                user_input_reactant = reactant
-                user_input_value = float(value)
-                user_input_index = i
-                break  # Stop once we find the first non-empty input
-
-        if user_input_reactant is None:
-            messagebox.showerror("Error", "Please enter a measurement for at least one reactant.")
-            return
-
-        # **Ensure the correct input reactant remains stored**
-        if user_selected_input is None or user_selected_input != user_input_reactant:
-            user_selected_input = user_input_reactant  
-            user_input_storage[user_selected_input] = user_input_value  
-
-        # **Prevent modifying user input**
-        if user_selected_input in user_input_storage:
-            user_input_value = user_input_storage[user_selected_input]
-
-        # Convert only if needed (for computation, not storage)
-        reference_moles = user_input_value if is_moles else user_input_value / molar_masses[user_selected_input]
-
-        # Compute moles of all reactants based on ratios
-        reactant_moles = {user_selected_input: reference_moles}
-        for reactant in reactants:
-            if reactant != user_selected_input:
-                coefficient = molesAndCompounds(reactant)[0]
-                user_coeff = molesAndCompounds(user_selected_input)[0]
-                reactant_moles[reactant] = reference_moles * (coefficient / user_coeff)
-
-        # Find the limiting reagent
-        smallest_ratio = float("inf")
-        limiting_reagent = None  
-
-        for reactant in reactant_moles:
-            ratio = reactant_moles[reactant] / molesAndCompounds(reactant)[0]
-            if ratio < smallest_ratio:
-                smallest_ratio = ratio
-                limiting_reagent = reactant
-
-        # Compute theoretical yield of products
-        results = {}
-        for compound in products:  
-            coefficient = molesAndCompounds(compound)[0]
-            limiting_coeff = molesAndCompounds(limiting_reagent)[0]
-            theoretical_moles = (reactant_moles[limiting_reagent] / limiting_coeff) * coefficient
-
-            # Convert to grams if unchecked
-            results[compound] = theoretical_moles if is_moles else theoretical_moles * molar_masses[compound]
-
-        # **Update outputs while keeping the user input unchanged**
-        for i, compound in enumerate(compounds):
-            if i == user_input_index:  
-                continue  # Do not modify user input
-            if compound not in ["", "="]:  
-                value = reactant_moles.get(compound, results.get(compound, 0))
-                entries[i].delete(0, tk.END)
-                entries[i].insert(0, f"{value:.4f}")
-
-        # **Ensure user input remains intact**
-        entries[user_input_index].delete(0, tk.END)
-        entries[user_input_index].insert(0, f"{user_input_storage[user_selected_input]:.4f}")
-
-        # Show Limiting Reagent
-        messagebox.showinfo("Limiting Reagent", f"The limiting reagent is {limiting_reagent}.")
-
-    except ValueError:
-        messagebox.showerror("Error", "Please enter a valid numeric input.")
-
-# Compute Button
-compute_button = tk.Button(root, text="Compute", command=compute_stoichiometry)
-compute_button.grid(row=4, column=3, padx=5, pady=5)
-
-root.mainloop()
\ No newline at end of file
+
+def main(equation_file=None):
+    """Build the calculator window for the first equation of equation_file (default: the sample input next to this script)."""
+    # The Reaction engine (and NumPy with it) is imported here so importing this module stays cheap
+    from reaction import Reaction, DEFAULT_EQUATION_FILE
+
+    # Read the equation from file (default: next to this script) and parse it once
+    reaction = Reaction.fromFile(equation_file or DEFAULT_EQUATION_FILE)
+    equation = reaction.equation
+
+    # Reactant and product terms as written in the equation
+    reactants = reaction.terms[reaction.reactantSlice]
+    products = reaction.terms[reaction.productSlice]
+
+    # Include separators but replace "|" with an empty string
+    compounds = reactants + [""] + ["="] + products  
+
+    # Ensure UI supports at least 6 columns
+    while len(compounds) < 6:
+        compounds.append("")
+
+    # GUI Setup
+    root = tk.Tk()
+    root.title("Stoichiometry Calculator")
+
+    # Display equation
+    tk.Label(root, text=equation).grid(row=0, column=0, columnspan=6, pady=10)
+
+    # First Row: Chemical Names
+    for i, compound in enumerate(compounds):
+        tk.Entry(root, justify="center", width=10, state="readonly",
+                 readonlybackground="white", fg="black").grid(row=1, column=i, padx=5, pady=5)
+        tk.Label(root, text=compound).grid(row=1, column=i, padx=5, pady=5)
+
+    # Second Row: Transformed Subscripts
+    for i, compound in enumerate(compounds):
+        transformed = transform_to_subscript(compound)
+        tk.Entry(root, justify="center", width=10, state="readonly",
+                 readonlybackground="white", fg="black").grid(row=2, column=i, padx=5, pady=5)
+        tk.Label(root, text=transformed).grid(row=2, column=i, padx=5, pady=5)
+
+    # Third Row: User Inputs & Computed Values
+    entries = []
+    for i, compound in enumerate(compounds):
+        entry = tk.Entry(root, justify="center")
+        entry.grid(row=3, column=i, padx=5, pady=5)
+        entries.append(entry)
+
+    # Label for user input cell
+    input_label = tk.Label(root, text="Input Cell", fg="gray", font=("Arial", 10, "italic"))
+    input_label.grid(row=4, column=1, pady=2)
+
+    # Checkbox for Moles/Grams
+    checkbox_var = tk.BooleanVar()
+    checkbox = tk.Checkbutton(root, text="Moles?", variable=checkbox_var)
+    checkbox.grid(row=4, column=2, padx=5, pady=5)
+
+    # Text this program wrote into each cell, so computed values are not read back as measurements
+    computed_cells = {}
+
+    # Compute Stoichiometry from every reactant the user measured, keeping their input cells unchanged
+    def compute_stoichiometry():
+        try:
+            is_moles = checkbox_var.get()
+
+            # Collect a measurement for every reactant; empty (or previously computed) cells are not measured
+            measured = []
+            for i, reactant in enumerate(reactants):
+                value = entries[i].get().strip()
+                measured.append(float(value) if value and value != computed_cells.get(i) else float("nan"))
+
+            if all(value != value for value in measured):  # every entry is NaN
+                messagebox.showerror("Error", "Please enter a measurement for at least one reactant.")
+                return
+
+            # Limiting reagent from all measurements at once
+            result = reaction.limiting(measured, moles=is_moles)
+            limiting_reagent = reactants[result.limiting[0]]
+            values = dict(zip(reactants, result.consumed[0]))
+            values.update(zip(products, result.yields[0]))
+
+            # **Update outputs while keeping the user inputs unchanged**
+            computed_cells.clear()
+            for i, compound in enumerate(compounds):
+                if i < len(reactants) and measured[i] == measured[i]:
+                    continue  # Do not modify user input
+                if compound not in ["", "="]:  
+                    text = f"{values.get(compound, 0):.4f}"
+                    entries[i].delete(0, tk.END)
+                    entries[i].insert(0, text)
+                    computed_cells[i] = text
+
+            # Show Limiting Reagent and the excess left over
+            unit = "mol" if is_moles else "g"
+            excess = [f"{reactant}: {left:.4f} {unit}" for reactant, left in zip(reactants, result.leftover[0])
+                      if left == left and reactant != limiting_reagent]
+            message = f"The limiting reagent is {limiting_reagent}."
+            if excess:
+                message += "\nLeft over: " + ", ".join(excess)
+            messagebox.showinfo("Limiting Reagent", message)
+
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid numeric input.")
+
+    # Compute Button
+    compute_button = tk.Button(root, text="Compute", command=compute_stoichiometry)
+    compute_button.grid(row=4, column=3, padx=5, pady=5)
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Automatic balancing of chemical equations.
+
+Every Homework 2 script assumes the equation in "Homework 2 short sample input.txt"
+is already balanced. balanceEquation() takes an unbalanced equation, builds the
+element x species composition matrix from atomCount (products negated), and finds
+its nullspace with exact rational arithmetic (fractions.Fraction). A balanced
+equation corresponds to a one-dimensional nullspace spanned by a vector whose
+entries all have the same sign; it is scaled to the smallest positive integers.
+
+Equations are flagged instead of raising, so a batch keeps going:
+    "balanced"       - unique smallest positive integer coefficients found
+    "unbalanceable"  - only the zero vector conserves every element
+    "ambiguous"      - more than one independent solution (nullspace dimension > 1)
+    "invalid"        - cannot be parsed, or the only solution needs a negative coefficient
+
+Example:
+    result = balanceEquation("Hg(OH)2 + H3PO4 = Hg3(PO4)2 + H2O")
+    result.coefficients      # [3, 2, 1, 6]
+    result.equation          # '3Hg(OH)2 + 2H3PO4 = Hg3(PO4)2 + 6H2O'
+"""
+
+import re
+import sys
+from collections import namedtuple
+from fractions import Fraction
+from math import gcd, lcm
+
+from chemistry_cache import cachedAtomCount
+
+BalanceResult = namedtuple("BalanceResult", "status coefficients equation reactants products message")
+
+_ARROW = re.compile(r"\s*(?:=|->|→|⟶)\s*")
+_COEFFICIENT = re.compile(r"^\s*(\d+)\s*")
+
+
+def splitEquation(equation):
+    """
+    Split "A + B = C + D" into reactant and product formulas, dropping any coefficients.
+
+    Returns: (reactants, products) - lists of formula strings
+    """
+    sides = _ARROW.split(equation.strip())
+    if len(sides) != 2:
+        raise ValueError(f"Expected exactly one '=' in {equation!r}")
+    reactants, products = ([_COEFFICIENT.sub("", term).strip() for term in side.split("+")] for side in sides)
+    if not all(reactants) or not all(products):
+        raise ValueError(f"Empty species in {equation!r}")
+    return reactants, products
+
+
+def compositionMatrix(reactants, products):
+    """
+    Element x species matrix of atom counts; product columns are negated.
+
+    Returns: (elements, rows) - element symbols and one list of ints per element
+    """
+    counts = [cachedAtomCount(species) for species in reactants + products]
+    elements = sorted({atom for atoms in counts for atom in atoms})
+    signs = [1] * len(reactants) + [-1] * len(products)
+    rows = [[sign * atoms.get(element, 0) for atoms, sign in zip(counts, signs)] for element in elements]
+    return elements, rows
+
+
+def nullspace(rows, columns):
+    """
+    Basis of the nullspace of an integer matrix, by exact Gauss-Jordan elimination.
+
+    Returns: list of basis vectors (lists of Fraction)
+    """
+    matrix = [[Fraction(value) for value in row] for row in rows]
+    pivots = []
+    pivotRow = 0
+    for column in range(columns):
+        found = next((r for r in range(pivotRow, len(matrix)) if matrix[r][column] != 0), None)
+        if found is None:
+            continue
+        matrix[pivotRow], matrix[found] = matrix[found], matrix[pivotRow]
+        pivot = matrix[pivotRow][column]
+        matrix[pivotRow] = [value / pivot for value in matrix[pivotRow]]
+        for r in range(len(matrix)):
+            factor = matrix[r][column]
+            if r != pivotRow and factor != 0:
+                matrix[r] = [value - factor * top for value, top in zip(matrix[r], matrix[pivotRow])]
+        pivots.append(column)
+        pivotRow += 1
+        if pivotRow == len(matrix):
+            break
+
+    basis = []
+    for free in (column for column in range(columns) if column not in pivots):
+        vector = [Fraction(0)] * columns
+        vector[free] = Fraction(1)
+        for row, column in enumerate(pivots):
+            vector[column] = -matrix[row][free]
+        basis.append(vector)
+    return basis
+
+
+def smallestIntegers(vector):
+    """Scale a rational vector to the smallest integer vector with the same direction."""
+    denominator = lcm(*(value.denominator for value in vector))
+    integers = [int(value * denominator) for value in vector]
+    divisor = gcd(*integers)
+    return [value // divisor for value in integers]
+
+
+def formatEquation(reactants, products, coefficients):
+    """Write species with their coefficients in the input-file layout (a coefficient of 1 is omitted)."""
+    terms = [f"{'' if n == 1 else n}{species}" for n, species in zip(coefficients, reactants + products)]
+    return " + ".join(terms[:len(reactants)]) + " = " + " + ".join(terms[len(reactants):])
+
+
+def balanceEquation(equation):
+    """
+    Balance one equation (coefficients already present in the input are ignored).
+
+    Returns: BalanceResult(status, coefficients, equation, reactants, products, message)
+    """
+    try:
+        reactants, products = splitEquation(equation)
+        elements, rows = compositionMatrix(reactants, products)
+    except ValueError as error:
+        return BalanceResult("invalid", None, None, None, None, str(error))
+
+    species = len(reactants) + len(products)
+    basis = nullspace(rows, species)
+    if not basis:
+        return BalanceResult("unbalanceable", None, None, reactants, products,
+                             "no non-zero coefficients conserve every element")
+    if len(basis) > 1:
+        return BalanceResult("ambiguous", None, None, reactants, products,
+                             f"{len(basis)} independent solutions")
+
+    coefficients = smallestIntegers(basis[0])
+    if all(value < 0 for value in coefficients):
+        coefficients = [-value for value in coefficients]
+    if any(value <= 0 for value in coefficients):
+        return BalanceResult("invalid", None, None, reactants, products,
+                             "the only solution needs a zero or negative coefficient")
+    return BalanceResult("balanced", coefficients, formatEquation(reactants, products, coefficients),
+                         reactants, products, "")
+
+
+def balanceMany(equations):
+    """Balance every equation of an iterable; returns a list of BalanceResult in input order."""
+    return [balanceEquation(equation) for equation in equations]
+
+
+if __name__ == "__main__":
+    for line in (sys.stdin if len(sys.argv) < 2 else open(sys.argv[1])):
+        if line.strip():
+            result = balanceEquation(line)
+            print(result.equation if result.status == "balanced" else f"{result.status}: {result.message}")
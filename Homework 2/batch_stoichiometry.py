@@ -0,0 +1,192 @@
+"""
+Batch stoichiometry for files of many equations.
+
+The GUI scripts read only the first line of the equation file. This script streams
+a file of any length, one balanced equation per line, optionally followed by a tab
+(or ';') and the measured amount of every reactant. Lines are read lazily and sent
+to a process pool in chunks. Only a bounded number of chunks are in flight, and the
+results are written to CSV as they arrive, in input order. A line that cannot be
+processed gets a message in the error column; the run carries on.
+
+Inside a chunk, lines that share an equation are solved together: the equation
+is parsed once into a Reaction (kept in a per-process LRU cache), and its
+measurements go through Reaction.limiting as one array.
+
+Input line:   3Hg(OH)2 + 2H3PO4 = Hg3(PO4)2 + 6H2O<TAB>30 10
+              (amounts are space separated, one per reactant; "-" or "nan" = not measured)
+Output CSV:   line, equation, molar_masses, limiting, extent, consumed, leftover, yields, error
+              (list columns are space separated, in equation order)
+
+Usage:
+    python batch_stoichiometry.py equations.txt results.csv --workers 8 --chunk-size 5000 [--moles]
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chemistry_cache import LRUCache
+from periodic_table import getPeriodicTable
+from reaction import Reaction
+
+COLUMNS = ["line", "equation", "molar_masses", "limiting", "extent", "consumed", "leftover", "yields", "error"]
+
+_FIELDS = re.compile(r"\t|;")
+_reactions = LRUCache(1024)  # equation -> Reaction, per worker process
+
+
+def readLines(fileName):
+    """Yield (line_number, text) for every non-blank line, numbered from 1 as in an editor."""
+    with open(fileName, "r") as file:
+        for number, line in enumerate(file, 1):
+            line = line.strip()
+            if line:
+                yield number, line
+
+
+def splitLine(text):
+    """
+    Split an input line into its equation and measurements.
+
+    Returns: (equation, amounts) - amounts is a list of floats (NaN = not measured) or None
+    """
+    fields = _FIELDS.split(text, maxsplit=1)
+    equation = fields[0].strip()
+    if len(fields) == 1 or not fields[1].strip():
+        return equation, None
+    amounts = [float("nan") if value == "-" else float(value) for value in fields[1].split()]
+    return equation, amounts
+
+
+def _join(values):
+    return " ".join(f"{value:.6g}" for value in values)
+
+
+def _formatRows(matrix):
+    """Space-separated text of every row of a 2-D array (one % format per row, on plain floats)."""
+    template = " ".join(["%.6g"] * matrix.shape[1])
+    return [template % tuple(row) for row in matrix.tolist()]
+
+
+def solveLines(lines, moles=False):
+    """
+    Results for one chunk of lines.
+
+    Returns: list of rows (lists matching COLUMNS), in the order of lines
+    """
+    rows = [None] * len(lines)
+    groups = {}  # equation -> [(position, amounts)]
+    for position, (number, text) in enumerate(lines):
+        try:
+            equation, amounts = splitLine(text)
+            groups.setdefault(equation, []).append((position, amounts))
+        except ValueError as error:
+            rows[position] = [number, text, "", "", "", "", "", "", str(error)]
+
+    for equation, members in groups.items():
+        try:
+            reaction = _reactions.get(equation, Reaction)
+        except (ValueError, KeyError) as error:
+            for position, _ in members:
+                rows[position] = [lines[position][0], equation, "", "", "", "", "", "", str(error) or "cannot parse"]
+            continue
+        masses = _join(reaction.molarMasses)
+        measuredRuns = []
+        for position, amounts in members:
+            number = lines[position][0]
+            if amounts is None:
+                rows[position] = [number, equation, masses, "", "", "", "", "", ""]
+            elif len(amounts) != len(reaction.reactants):
+                rows[position] = [number, equation, masses, "", "", "", "", "",
+                                  f"expected {len(reaction.reactants)} amounts, found {len(amounts)}"]
+            else:
+                measuredRuns.append((position, amounts))
+        if not measuredRuns:
+            continue
+
+        result = reaction.limiting(np.array([amounts for _, amounts in measuredRuns]), moles)
+        columns = zip(result.limiting.tolist(), result.extent.tolist(), _formatRows(result.consumed),
+                      _formatRows(result.leftover), _formatRows(result.yields))
+        for (position, _), (limiting, extent, consumed, leftover, yields) in zip(measuredRuns, columns):
+            number = lines[position][0]
+            if limiting < 0:
+                rows[position] = [number, equation, masses, "", "", "", "", "", "no reactant measured"]
+            else:
+                rows[position] = [number, equation, masses, reaction.reactants[limiting], "%.6g" % extent,
+                                  consumed, leftover, yields, ""]
+    return rows
+
+
+def _chunks(lines, chunkSize):
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == chunkSize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def runBatch(inputFile, outputFile, workers=None, chunkSize=5000, moles=False):
+    """
+    Process every line of inputFile and write the results to outputFile (CSV) in input order.
+
+    Args: workers - number of worker processes (default: all CPUs); 1 runs in-process
+          chunkSize - lines sent to a worker at a time
+          moles - measurements and results in moles instead of grams
+
+    Returns: number of lines processed
+    """
+    workers = workers or os.cpu_count() or 1
+    getPeriodicTable()  # build the JSON cache once, before the workers start reading it
+    chunks = _chunks(readLines(inputFile), chunkSize)
+    processed = 0
+    with open(outputFile, "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(COLUMNS)
+        if workers == 1:
+            for chunk in chunks:
+                writer.writerows(solveLines(chunk, moles))
+                processed += len(chunk)
+            return processed
+
+        maxPending = 2 * workers
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(solveLines, chunk, moles))
+                # Futures are drained oldest first, which keeps the output in input order.
+                while len(pending) >= maxPending:
+                    rows = pending.popleft().result()
+                    writer.writerows(rows)
+                    processed += len(rows)
+            while pending:
+                rows = pending.popleft().result()
+                writer.writerows(rows)
+                processed += len(rows)
+    return processed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Molar masses, limiting reagents and yields for many equations.")
+    parser.add_argument("input_file")
+    parser.add_argument("output_file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="lines per task")
+    parser.add_argument("--moles", action="store_true", help="amounts are in moles instead of grams")
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0 or (args.workers is not None and args.workers <= 0):
+        parser.error("--workers and --chunk-size must be positive")
+    count = runBatch(args.input_file, args.output_file, args.workers, args.chunk_size, args.moles)
+    print(f"Processed {count} lines into {args.output_file}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Bounded LRU memoization for the Chemistry helpers.
+
+Batch jobs (composition_matrix.parseFormulas, and through it every Reaction and
+batch_stoichiometry.py, plus balance_equation.py) parse the same compound strings
+again and again. The cache here keys on the normalized formula (whitespace removed,
+hydrate dots unified), so repeated parses become dictionary lookups. It is
+size-bounded and counts hits, misses and evictions.
+
+Example:
+    from chemistry_cache import cachedAtomCount, cacheStats, clearCaches
+    cachedAtomCount("Hg3(PO4)2")      # parsed once
+    cachedAtomCount("Hg3 (PO4)2")     # same normalized key: a hit
+    cacheStats()                      # {'atomCount': {'hits': 1, 'misses': 1, ...}}
+"""
+
+from collections import OrderedDict
+
+from Chemistry import atomCount
+
+DEFAULT_MAXSIZE = 4096
+
+
+class LRUCache:
+    """
+    Size-bounded least-recently-used cache with hit/miss/eviction counters.
+
+    Args: maxsize - number of entries kept before the least recently used one is evicted
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, compute):
+        """Return the cached value for key, calling compute(key) and storing the result on a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = compute(key)
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+
+def normalizeFormula(compound):
+    """Cache key for a formula: no whitespace, and every hydrate dot written as '·'."""
+    key = "".join(compound.split())
+    for dot in "•∙*":
+        key = key.replace(dot, "·")
+    return key
+
+
+atomCountCache = LRUCache()
+
+
+def cachedAtomCount(compound):
+    """atomCount with memoization; returns a fresh dict so callers may modify it."""
+    return dict(atomCountCache.get(normalizeFormula(compound), atomCount))
+
+
+def cacheStats():
+    """Counters of the module-level caches, keyed by cached helper."""
+    return {"atomCount": atomCountCache.stats()}
+
+
+def clearCaches():
+    """Empty the module-level caches (e.g. between batch jobs) and reset their counters."""
+    atomCountCache.clear()
@@ -0,0 +1,133 @@
+"""
+Composition-matrix engine for batch molar-mass computation.
+
+get_molar_mass in the GUI scripts sums float(mass) * int(count) in a Python
+generator, one compound at a time. Here a list of formulas is parsed into a
+sparse compounds x elements count matrix (CSR layout: indptr, indices, data, with
+columns indexed by atomic number). One sparse matrix-vector product against the
+periodic-table mass vector then gives every molar mass at once. Formulas are
+parsed in chunks, and iterMolarMasses() yields one chunk of results at a time,
+so memory stays bounded for libraries of 10^5 - 10^6 formulas. Formulas go
+through the atomCount LRU cache in chemistry_cache, so repeats are lookups.
+
+Example:
+    matrix = parseFormulas(["H2O", "CuSO4·5H2O", "Hg3(PO4)2"])
+    matrix.dot(getPeriodicTable().masses)        # molar masses
+    molarMasses(formulas, chunkSize=50_000)       # same thing, chunk by chunk
+"""
+
+import numpy as np
+
+from chemistry_cache import atomCountCache, normalizeFormula
+from Chemistry import atomCount
+from periodic_table import getPeriodicTable
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+class CompositionMatrix:
+    """
+    Sparse (compounds x elements) atom-count matrix in CSR layout.
+
+    Attributes: indptr - row i owns indices/data[indptr[i]:indptr[i + 1]]
+                indices - atomic number of each stored count
+                data - atom count
+                shape - (number of compounds, number of elements + 1)
+                invalid - boolean array, True for formulas that could not be parsed (errors="nan")
+    """
+
+    def __init__(self, indptr, indices, data, shape, invalid=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+        self.invalid = np.zeros(shape[0], dtype=bool) if invalid is None else invalid
+
+    def __len__(self):
+        return self.shape[0]
+
+    def rowIds(self):
+        """Row number of every stored entry."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def dot(self, vector):
+        """Sparse matrix-vector product: vector[z] weighted by each compound's count of element z."""
+        vector = np.asarray(vector, dtype=np.float64)
+        if len(vector) < self.shape[1]:
+            raise ValueError(f"Vector has {len(vector)} entries, matrix has {self.shape[1]} columns.")
+        products = self.data * vector[self.indices]
+        result = np.bincount(self.rowIds(), weights=products, minlength=self.shape[0])
+        result[self.invalid] = np.nan
+        return result
+
+    def toDense(self):
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self.rowIds(), self.indices] = self.data
+        return dense
+
+    def toScipy(self):
+        """scipy.sparse.csr_matrix view of the same arrays (scipy is optional)."""
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def parseFormulas(formulas, table=None, errors="raise"):
+    """
+    Parse formulas into a CompositionMatrix.
+
+    Args: formulas - sequence of formula strings (a leading coefficient is ignored, as in atomCount)
+          table - PeriodicTable giving the column of each element (default: getPeriodicTable())
+          errors - "raise" to stop on a bad formula, "nan" to leave an empty row marked invalid
+
+    Returns: CompositionMatrix with one row per formula
+    """
+    if errors not in ("raise", "nan"):
+        raise ValueError('errors must be "raise" or "nan".')
+    table = getPeriodicTable() if table is None else table
+    index = table.index
+    indptr = np.zeros(len(formulas) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    invalid = np.zeros(len(formulas), dtype=bool)
+    for row, formula in enumerate(formulas):
+        try:
+            atoms = atomCountCache.get(normalizeFormula(formula), atomCount)  # read-only: no copy needed
+            columns = [index[atom] for atom in atoms]
+        except (ValueError, KeyError) as error:
+            if errors == "raise":
+                reason = f"no mass for element {error.args[0]!r}" if isinstance(error, KeyError) else error
+                raise ValueError(f"Cannot parse formula {formula!r}: {reason}") from error
+            invalid[row] = True
+            atoms, columns = {}, []
+        indices.extend(columns)
+        data.extend(atoms.values())
+        indptr[row + 1] = len(indices)
+    return CompositionMatrix(indptr, np.array(indices, dtype=np.int32), np.array(data, dtype=np.int64),
+                             (len(formulas), len(table.masses)), invalid)
+
+
+def iterMolarMasses(formulas, chunkSize=DEFAULT_CHUNK_SIZE, table=None, errors="raise"):
+    """
+    Molar masses of an iterable of formulas, one chunk at a time.
+
+    Only chunkSize formulas are held as a matrix at once, so the input can be a lazy
+    iterator over a very large file.
+
+    Returns: generator of float64 arrays (NaN for unparsable formulas when errors="nan")
+    """
+    table = getPeriodicTable() if table is None else table
+    chunk = []
+    for formula in formulas:
+        chunk.append(formula)
+        if len(chunk) == chunkSize:
+            yield parseFormulas(chunk, table, errors).dot(table.masses)
+            chunk = []
+    if chunk:
+        yield parseFormulas(chunk, table, errors).dot(table.masses)
+
+
+def molarMasses(formulas, chunkSize=DEFAULT_CHUNK_SIZE, table=None, errors="raise"):
+    """Molar masses of all formulas as one float64 array."""
+    pieces = list(iterMolarMasses(formulas, chunkSize, table, errors))
+    return np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float64)
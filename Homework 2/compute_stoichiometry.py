@@ -1,38 +1,23 @@
-import tkinter as tk
-from tkinter import messagebox
-from Chemistry import molesAndCompounds, atomCount, splitOnAtomCount, symbolAndMasses, numberAsSubscript
-
-# The equation from file
-with open("/Users/ika/Desktop/Spring_2025/CS5630/Homework 2/Homework 2 short sample input.txt", "r") as file:
-    equation = file.readline().strip()
- 
 """
-Parse equation dynamically for any number of reactants/products - have also ensured that this 
-works for all types of balanced checmical equations irrespective of the number of reactants/products
+The calculator window never blocks: calculations run on a worker thread and their
+results come back to the Tk main thread through a queue polled with after().
+Toggling "Moles?" is debounced, so a burst of clicks triggers a single calculation.
+Only the cells whose text changed are rewritten, and the limiting reagent and any
+errors go to a status line instead of a modal messagebox. The compounds sit in a
+horizontally scrollable grid that creates widgets only for the columns in view, so
+equations can have any number of species.
 """
-reactants, products = equation.split("=")
-reactants = [r.strip() for r in reactants.split("+")]
-products = [p.strip() for p in products.split("+")]
-compounds = reactants + ["|", "="] + products  # For use in dynamically build of UI structure
-
-print(f"Reactants: {reactants}")
-print(f"Products: {products}")
-print(f"Full compounds list: {compounds}")
-
-# Ensure UI supports at least 6 columns
-while len(compounds) < 6: # Only supports 6 columns for now. 
-    compounds.append("")
 
-# Get the atomic masses from periodic table data provided. 
-periodic_data = symbolAndMasses("/Users/ika/Desktop/Spring_2025/CS5630/Homework 2/PeriodicTableData.xls")
-
-# Compute molar masses safely
-def get_molar_mass(compound):
-    atoms = atomCount(compound)
-    return sum(float(periodic_data[element]) * int(count) for element, count in atoms.items())
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from Chemistry import splitOnAtomCount, numberAsSubscript
 
-# Store molar masses for all compounds
-molar_masses = {compound: get_molar_mass(compound) for compound in compounds if compound and compound not in ["|", "="]}
+COLUMN_WIDTH = 110  # pixels per compound column
+VISIBLE_COLUMNS = 6  # columns shown before the grid has to scroll
+DEBOUNCE_MS = 250  # quiet time after the last toggle before recomputing
+POLL_MS = 30  # how often the main thread checks for finished calculations
+SEPARATORS = ["|", "="]
 
 
 def transform_to_subscript(compound):
@@ -50,112 +35,195 @@ def transform_to_subscript(compound):
         transformed += f"{numberAsSubscript(part)}" if (part.isdigit() and parts.index(part) != 0) else part
     return transformed
 
-# GUI Setup
-root = tk.Tk()
-root.title("Stoichiometry Calculator")
-
-# Display the checmical equation under the title. 
-tk.Label(root, text=equation).grid(row=0, column=0, columnspan=6, pady=10)
-
-# First Row: Chemical Names
-for i, compound in enumerate(compounds):
-    tk.Label(root, text=compound).grid(row=1, column=i, padx=5, pady=5)
-
-# Second Row: Transformed Subscripts
-for i, compound in enumerate(compounds):
-    transformed = transform_to_subscript(compound) if compound not in ["|", "="] else compound
-    tk.Label(root, text=transformed).grid(row=2, column=i, padx=5, pady=5)
-
-# Third Row: User Inputs (Goes into the second cell) & Computed Values
-entries = []
-for i in range(6):
-    entry = tk.Entry(root, justify="center")
-    entry.grid(row=3, column=i, padx=5, pady=5)
-    entries.append(entry)
-
-# Only ONE user input cell. 
-tk.Label(root, text="Lab Measurement (grams):").grid(row=4, column=0, padx=5, pady=5)
-entry_lab_measurement = tk.Entry(root, justify="center")
-entry_lab_measurement.grid(row=4, column=1, padx=5, pady=5)
-
-# Checkbox for Moles/Grams - Calls Compute Function on Toggle
-checkbox_var = tk.BooleanVar()
-checkbox = tk.Checkbutton(root, text="Moles?", variable=checkbox_var, command=lambda: compute_stoichiometry())
-checkbox.grid(row=4, column=2, padx=5, pady=5)
-
-# Function to Compute Stoichiometry with Limiting Reagent
-def compute_stoichiometry():
-    try:
-        lab_measurement = float(entry_lab_measurement.get())  # user input in grams or moles
-        is_moles = checkbox_var.get()
 
-        # Convert the single input to moles if it's in grams
-        reference_compound = reactants[1]  # The second reactant is used as input reference
-        if not is_moles:
-            reference_moles = lab_measurement / molar_masses[reference_compound]  # Convert grams to moles
-        else:
-            reference_moles = lab_measurement  # Already in moles
-
-        # Compute moles of all reactants based on stoichiometric ratios
-        reactant_moles = {}
-        reactant_masses = {}  # Track reactant masses correctly
-        reactant_moles[reference_compound] = reference_moles  # Ensure input is set properly
-
-        for reactant in reactants:
-            if reactant != reference_compound:  # Other reactants should be computed
-                parsed_data = molesAndCompounds(reactant)
-                if not parsed_data or len(parsed_data) < 2:
-                    raise ValueError(f"Error parsing reactant: {reactant}, received: {parsed_data}")
-                coefficient = parsed_data[0]
-                reactant_moles[reactant] = reference_moles * (coefficient / molesAndCompounds(reference_compound)[0])
-        
-        # Convert to grams if checkbox is **unchecked**
-        for reactant in reactants:
-            reactant_masses[reactant] = reactant_moles[reactant] * molar_masses[reactant] if not is_moles else reactant_moles[reactant]
-
-        # Find the limiting reagent correctly based on **moles**
-        smallest_ratio = float("inf")
-        limiting_reagent = None  # Track a single limiting reagent
-
-        for reactant in reactant_moles:
-            ratio = reactant_moles[reactant] / molesAndCompounds(reactant)[0]
-            print(f"Checking Limiting Reagent: {reactant}, Ratio: {ratio:.6f}")  # Debugging Output
-
-            if ratio < smallest_ratio:
-                smallest_ratio = ratio
-                limiting_reagent = reactant  # Track first smallest reagent
-
-        print(f"Final Limiting Reagent: {limiting_reagent}")
-
-        # Compute theoretical yield of products based on limiting reagent
-        results = {}
-        for compound in products:  # Iterate over all products dynamically
-            parsed_data = molesAndCompounds(compound)
-            if not parsed_data or len(parsed_data) < 2:
-                raise ValueError(f"Error parsing product: {compound}, received: {parsed_data}")
-
-            coefficient = parsed_data[0]
-            limiting_coeff = molesAndCompounds(limiting_reagent)[0]
-            theoretical_moles = (reactant_moles[limiting_reagent] / limiting_coeff) * coefficient
-
-            # Convert to grams if checkbox is unchecked (grams mode)
-            results[compound] = theoretical_moles if is_moles else theoretical_moles * molar_masses[compound]
-
-        # Populate the outputs dynamically for **all valid reactants and products**
-        for i, compound in enumerate(compounds):
-            if compound not in ["|", "="]:  # Skip separators
-                value = reactant_masses.get(compound, results.get(compound, 0))
-                entries[i].delete(0, tk.END)
-                entries[i].insert(0, f"{value:.4f}")
-
-        # Show Limiting Reagent
-        messagebox.showinfo("Limiting Reagent", f"The limiting reagent is {limiting_reagent}.")
-
-    except ValueError:
-        messagebox.showerror("Error", "Please enter a valid numeric input.")
-
-# Compute Button (Calls compute_stoichiometry)
-compute_button = tk.Button(root, text="Compute", command=compute_stoichiometry)
-compute_button.grid(row=4, column=3, padx=5, pady=5)
-
-root.mainloop()
\ No newline at end of file
+class ColumnGrid:
+    """
+    Horizontally scrollable grid with one column per compound: name, subscripted formula, value.
+
+    Only the columns inside the visible part of the canvas have widgets; scrolling creates
+    the columns coming into view and destroys those leaving it. Cell values are kept here,
+    so a column shows its current value whenever it is created again.
+
+    Args: parent - Tk container
+          compounds - column headings (separators such as "=" get no value cell)
+    """
+
+    def __init__(self, parent, compounds, column_width=COLUMN_WIDTH):
+        self.compounds = compounds
+        self.column_width = column_width
+        self.values = [""] * len(compounds)
+        self.visible = {}  # column index -> (canvas window id, frame, value entry or None)
+
+        self.canvas = tk.Canvas(parent, height=110, highlightthickness=0,
+                                width=min(len(compounds), VISIBLE_COLUMNS) * column_width)
+        self.scrollbar = tk.Scrollbar(parent, orient="horizontal", command=self._scroll)
+        self.canvas.configure(xscrollcommand=self.scrollbar.set,
+                              scrollregion=(0, 0, len(compounds) * column_width, 110))
+        self.canvas.bind("<Configure>", lambda event: self.refresh())
+
+    def grid(self, row, **options):
+        self.canvas.grid(row=row, column=0, columnspan=4, sticky="ew", **options)
+        self.scrollbar.grid(row=row + 1, column=0, columnspan=4, sticky="ew")
+
+    def _scroll(self, *args):
+        self.canvas.xview(*args)
+        self.refresh()
+
+    def _create_column(self, i):
+        compound = self.compounds[i]
+        frame = tk.Frame(self.canvas)
+        tk.Label(frame, text=compound).grid(row=0, column=0, padx=5, pady=5)
+        transformed = compound if compound in SEPARATORS else transform_to_subscript(compound)
+        tk.Label(frame, text=transformed).grid(row=1, column=0, padx=5, pady=5)
+        entry = None
+        if compound not in SEPARATORS:
+            entry = tk.Entry(frame, justify="center", width=12)
+            entry.insert(0, self.values[i])
+            entry.grid(row=2, column=0, padx=5, pady=5)
+        window = self.canvas.create_window(i * self.column_width, 0, window=frame, anchor="nw",
+                                           width=self.column_width)
+        self.visible[i] = (window, frame, entry)
+
+    def refresh(self):
+        """Create widgets for the columns in view and destroy the ones scrolled out of it."""
+        left = self.canvas.canvasx(0)
+        right = left + max(self.canvas.winfo_width(), self.column_width)
+        first = max(0, int(left // self.column_width))
+        last = min(len(self.compounds) - 1, int(right // self.column_width))
+        for i in [i for i in self.visible if not first <= i <= last]:
+            window, frame, _ = self.visible.pop(i)
+            self.canvas.delete(window)
+            frame.destroy()
+        for i in range(first, last + 1):
+            if i not in self.visible:
+                self._create_column(i)
+
+    def set_values(self, values):
+        """Store new cell texts; only visible cells whose text differs are rewritten."""
+        for i, text in enumerate(values):
+            self.values[i] = text
+            entry = self.visible.get(i, (None, None, None))[2]
+            if entry is not None and entry.get() != text:
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+
+
+def main(equation_file=None):
+    """Build the calculator window for the first equation of equation_file (default: the sample input next to this script)."""
+    # The Reaction engine (and NumPy with it) is imported here so importing this module stays cheap
+    from reaction import Reaction, DEFAULT_EQUATION_FILE
+
+    # The equation from file (default: next to this script), parsed once into coefficients and molar masses
+    reaction = Reaction.fromFile(equation_file or DEFAULT_EQUATION_FILE)
+    equation = reaction.equation
+
+    """
+    Parse equation dynamically for any number of reactants/products - have also ensured that this
+    works for all types of balanced checmical equations irrespective of the number of reactants/products
+    """
+    reactants = reaction.terms[reaction.reactantSlice]
+    products = reaction.terms[reaction.productSlice]
+    compounds = reactants + SEPARATORS + products  # For use in dynamically build of UI structure
+
+    print(f"Reactants: {reactants}")
+    print(f"Products: {products}")
+    print(f"Full compounds list: {compounds}")
+
+    # The second reactant is used as input reference (the only one if there is just one)
+    reference = min(1, len(reactants) - 1)
+
+    # GUI Setup
+    root = tk.Tk()
+    root.title("Stoichiometry Calculator")
+
+    # Display the checmical equation under the title.
+    tk.Label(root, text=equation).grid(row=0, column=0, columnspan=4, pady=10)
+
+    # Rows one to three: names, subscripted formulas and computed values, one scrollable column per compound
+    grid = ColumnGrid(root, compounds)
+    grid.grid(row=1)
+
+    # Only ONE user input cell.
+    measurement_label = tk.Label(root, text="Lab Measurement (grams):")
+    measurement_label.grid(row=3, column=0, padx=5, pady=5)
+    entry_lab_measurement = tk.Entry(root, justify="center")
+    entry_lab_measurement.grid(row=3, column=1, padx=5, pady=5)
+
+    # Status line for the limiting reagent and input errors (replaces the modal messagebox)
+    status = tk.Label(root, text="", anchor="w")
+    status.grid(row=4, column=0, columnspan=4, sticky="ew", padx=5, pady=5)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    finished = queue.Queue()  # (request number, amounts or exception), filled by the worker thread
+    state = {"request": 0, "pending": 0, "debounce": None}
+
+    def calculate(request, lab_measurement, is_moles):
+        """Runs on the worker thread: never touches a widget."""
+        try:
+            finished.put((request, reaction.compute(lab_measurement, reference, moles=is_moles)[0]))
+        except Exception as error:
+            finished.put((request, error))
+
+    def poll():
+        """Runs on the main thread: apply the newest finished calculation, drop stale ones."""
+        while True:
+            try:
+                request, outcome = finished.get_nowait()
+            except queue.Empty:
+                break
+            state["pending"] -= 1
+            if request != state["request"]:
+                continue  # a newer calculation was requested since this one started
+            if isinstance(outcome, Exception):
+                status.config(text=f"Error: {outcome}", fg="red")
+                continue
+            values = dict(zip(reactants + products, outcome))
+            grid.set_values(["" if compound in SEPARATORS else f"{values[compound]:.4f}" for compound in compounds])
+            status.config(text=f"The limiting reagent is {reactants[reference]}.", fg="black")
+        if state["pending"] > 0:
+            root.after(POLL_MS, poll)
+
+    # Function to Compute Stoichiometry with Limiting Reagent (on the worker thread)
+    def compute_stoichiometry():
+        state["debounce"] = None
+        is_moles = checkbox_var.get()
+        measurement_label.config(text=f"Lab Measurement ({'moles' if is_moles else 'grams'}):")
+        try:
+            lab_measurement = float(entry_lab_measurement.get())  # user input in grams or moles
+        except ValueError:
+            status.config(text="Please enter a valid numeric input.", fg="red")
+            return
+        state["request"] += 1
+        state["pending"] += 1
+        status.config(text="Computing...", fg="gray")
+        executor.submit(calculate, state["request"], lab_measurement, is_moles)
+        if state["pending"] == 1:
+            root.after(POLL_MS, poll)
+
+    def schedule_compute():
+        """Debounce: restart the quiet period on every toggle, compute once it has passed."""
+        if state["debounce"] is not None:
+            root.after_cancel(state["debounce"])
+        state["debounce"] = root.after(DEBOUNCE_MS, compute_stoichiometry)
+
+    # Checkbox for Moles/Grams - Recomputes once the toggling stops
+    checkbox_var = tk.BooleanVar()
+    checkbox = tk.Checkbutton(root, text="Moles?", variable=checkbox_var, command=schedule_compute)
+    checkbox.grid(row=3, column=2, padx=5, pady=5)
+
+    # Compute Button (Calls compute_stoichiometry); Return in the input cell does the same
+    compute_button = tk.Button(root, text="Compute", command=compute_stoichiometry)
+    compute_button.grid(row=3, column=3, padx=5, pady=5)
+    entry_lab_measurement.bind("<Return>", lambda event: compute_stoichiometry())
+
+    def close():
+        executor.shutdown(wait=False)
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", close)
+    grid.refresh()
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
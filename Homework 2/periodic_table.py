@@ -0,0 +1,132 @@
+"""
+Precompiled periodic table cache.
+
+symbolAndMasses used to open PeriodicTableData.xls with xlrd on every call and
+return masses as whatever the cell held (strings), so every caller converted them
+with float() again. compilePeriodicTable() reads the workbook once and writes a
+small JSON cache next to it; later runs load the JSON and never import xlrd. The
+cache records the size and modification time of the workbook and is rebuilt only
+when the workbook changes.
+
+In memory the table is a float64 NumPy array of masses indexed by atomic number
+(index 0 is unused) plus a symbol -> atomic number map. NumPy is imported when
+the first table is built, not when this module is imported.
+
+Example:
+    table = getPeriodicTable()          # loaded lazily on first use
+    table.mass("Hg")                    # 200.6
+    table.masses[table.index["O"]]      # 16.0
+
+    python periodic_table.py [PeriodicTableData.xls]      # (re)build the cache explicitly
+"""
+
+import json
+import os
+import sys
+
+DEFAULT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PeriodicTableData.xls")
+CACHE_SUFFIX = ".cache.json"
+_CACHE_VERSION = 1
+
+_tables = {}  # absolute source path -> PeriodicTable, filled on first use
+
+
+class PeriodicTable:
+    """
+    Element symbols and masses indexed by atomic number.
+
+    Attributes: symbols - list, symbols[z] is the symbol of atomic number z (symbols[0] is "")
+                masses - float64 array, masses[z] is the molar mass of atomic number z (masses[0] is NaN)
+                index - dictionary - key is symbol, value is atomic number
+    """
+
+    def __init__(self, symbols, masses):
+        import numpy as np  # deferred so that importing this module stays cheap
+
+        self.symbols = list(symbols)
+        self.masses = np.asarray(masses, dtype=np.float64)
+        self.index = {symbol: number for number, symbol in enumerate(self.symbols) if symbol}
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, symbol):
+        return symbol in self.index
+
+    def mass(self, symbol):
+        return float(self.masses[self.index[symbol]])
+
+    def asDict(self):
+        """Dictionary - key is atom, value is mass as float (the symbolAndMasses layout)."""
+        return {symbol: float(self.masses[number]) for symbol, number in self.index.items()}
+
+
+def _sourceStamp(source):
+    status = os.stat(source)
+    return {"size": status.st_size, "mtime_ns": status.st_mtime_ns}
+
+
+def cachePath(source=DEFAULT_SOURCE):
+    return source + CACHE_SUFFIX
+
+
+def readWorkbook(source=DEFAULT_SOURCE):
+    """Slow path: read symbols and masses from the .xls workbook with xlrd."""
+    import xlrd  # only needed when the cache is missing or stale
+
+    sheet = xlrd.open_workbook(source).sheet_by_index(0)
+    numbers = [int(value) for value in sheet.col_values(0, 1)]
+    symbols = [""] * (max(numbers) + 1)
+    masses = [float("nan")] * (max(numbers) + 1)
+    for number, symbol, mass in zip(numbers, sheet.col_values(1, 1), sheet.col_values(6, 1)):
+        symbols[number] = str(symbol).strip()
+        masses[number] = float(mass)
+    return PeriodicTable(symbols, masses)
+
+
+def compilePeriodicTable(source=DEFAULT_SOURCE):
+    """
+    Read the workbook and write the JSON cache next to it.
+
+    Returns: the PeriodicTable that was compiled
+    """
+    table = readWorkbook(source)
+    payload = {
+        "version": _CACHE_VERSION,
+        "source": _sourceStamp(source),
+        "symbols": table.symbols,
+        # NaN is not valid JSON; the unused slot 0 is stored as null.
+        "masses": [None if mass != mass else mass for mass in table.masses.tolist()],
+    }
+    try:
+        with open(cachePath(source), "w") as file:
+            json.dump(payload, file)
+    except OSError:
+        pass  # read-only location: keep working from memory, the workbook is read again next run
+    return table
+
+
+def loadPeriodicTable(source=DEFAULT_SOURCE):
+    """Load the cache if it matches the workbook, otherwise rebuild it first."""
+    try:
+        with open(cachePath(source)) as file:
+            payload = json.load(file)
+        if payload.get("version") == _CACHE_VERSION and payload.get("source") == _sourceStamp(source):
+            masses = [float("nan") if mass is None else mass for mass in payload["masses"]]
+            return PeriodicTable(payload["symbols"], masses)
+    except (OSError, ValueError, KeyError):
+        pass
+    return compilePeriodicTable(source)
+
+
+def getPeriodicTable(source=DEFAULT_SOURCE):
+    """PeriodicTable for the given workbook, loaded lazily once per process."""
+    key = os.path.abspath(source)
+    if key not in _tables:
+        _tables[key] = loadPeriodicTable(source)
+    return _tables[key]
+
+
+if __name__ == "__main__":
+    table = compilePeriodicTable(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOURCE)
+    print(f"Cached {len(table)} elements")
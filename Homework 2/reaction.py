@@ -0,0 +1,200 @@
+"""
+Headless stoichiometry engine.
+
+compute_stoichiometry.py, Lab_measurement.py and trial_all_reagents.py each parse
+the equation and do the mole arithmetic inside a tkinter callback that reads Entry
+widgets. Reaction parses a balanced equation once and stores the coefficients
+and molar masses as NumPy arrays. Measurements then go in as arrays, in grams or
+moles, so one call handles a single GUI value or a whole batch of lab runs.
+
+Every amount is derived from the reaction extent: moles of a species divided by
+its coefficient. A measurement of one reactant gives the extent, and the extent
+times the coefficients gives every other species.
+
+Example:
+    reaction = Reaction("3Hg(OH)2 + 2H3PO4 = Hg3(PO4)2 + 6H2O")
+    reaction.requirements([1.0, 2.5], reference=1)     # grams of every reactant, shape (2, 2)
+    reaction.yields([1.0, 2.5], reference=1)           # grams of every product, shape (2, 2)
+    reaction.yields(0.5, reference=1, moles=True)      # moles of every product, shape (1, 2)
+
+    measured = np.array([[30.0, 10.0], [40.0, 10.0]])   # grams of each reactant, one row per run
+    result = reaction.limiting(measured)
+    result.limiting                                     # [0, 1] - index of the limiting reactant per run
+    result.leftover                                     # grams of each reactant left unconsumed
+"""
+
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from composition_matrix import parseFormulas
+from periodic_table import getPeriodicTable
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EQUATION_FILE = os.path.join(HERE, "Homework 2 short sample input.txt")
+
+LimitingResult = namedtuple("LimitingResult", "limiting extent consumed leftover yields")
+
+_TERM = re.compile(r"^\s*(\d*)\s*(\S.*?)\s*$")
+
+
+def readEquation(fileName=DEFAULT_EQUATION_FILE):
+    """First line of an equation file, as the GUI scripts read it."""
+    with open(fileName, "r") as file:
+        return file.readline().strip()
+
+
+def parseTerm(term):
+    """
+    Split one side term into its coefficient and formula.
+
+    Args: term - e.g. "3Hg(OH)2" or "H2O"
+
+    Returns: (coefficient, formula) - e.g. (3, "Hg(OH)2"); the coefficient defaults to 1
+    """
+    match = _TERM.match(term)
+    if match is None:
+        raise ValueError("Empty term in equation.")
+    coefficient = int(match.group(1)) if match.group(1) else 1
+    if coefficient <= 0:
+        raise ValueError(f"Coefficient of {term.strip()!r} must be positive.")
+    return coefficient, match.group(2)
+
+
+class Reaction:
+    """
+    A balanced equation with its coefficients and molar masses as arrays.
+
+    Args: equation - balanced equation such as "3Hg(OH)2 + 2H3PO4 = Hg3(PO4)2 + 6H2O"
+          table - PeriodicTable for the molar masses (default: getPeriodicTable())
+
+    Attributes: reactants, products - formulas without coefficients
+                terms - the reactant and product terms as written in the equation
+                coefficients - int64 array, one entry per species (reactants first)
+                molarMasses - float64 array, one entry per species
+    """
+
+    def __init__(self, equation, table=None):
+        sides = equation.strip().split("=")
+        if len(sides) != 2:
+            raise ValueError(f"Expected exactly one '=' in {equation!r}")
+        self.equation = equation.strip()
+        self.terms = [term.strip() for side in sides for term in side.split("+")]
+        parsed = [parseTerm(term) for term in self.terms]
+        reactantCount = len(sides[0].split("+"))
+        formulas = [formula for _, formula in parsed]
+        self.reactants = formulas[:reactantCount]
+        self.products = formulas[reactantCount:]
+        self.coefficients = np.array([coefficient for coefficient, _ in parsed], dtype=np.int64)
+        table = getPeriodicTable() if table is None else table
+        self.molarMasses = parseFormulas(formulas, table).dot(table.masses)
+
+    @classmethod
+    def fromFile(cls, fileName=DEFAULT_EQUATION_FILE, table=None):
+        """Reaction for the first line of an equation file."""
+        return cls(readEquation(fileName), table)
+
+    @property
+    def species(self):
+        return self.reactants + self.products
+
+    @property
+    def reactantSlice(self):
+        return slice(0, len(self.reactants))
+
+    @property
+    def productSlice(self):
+        return slice(len(self.reactants), len(self.terms))
+
+    def __repr__(self):
+        return f"Reaction({self.equation!r})"
+
+    def speciesIndex(self, species):
+        """Column of a species, given as an index or as a formula (with or without coefficient)."""
+        if isinstance(species, (int, np.integer)):
+            if not -len(self.terms) <= species < len(self.terms):
+                raise IndexError(f"Species index {species} out of range for {self!r}.")
+            return int(species) % len(self.terms)
+        for number, (term, formula) in enumerate(zip(self.terms, self.species)):
+            if species in (term, formula):
+                return number
+        raise ValueError(f"{species!r} is not part of {self!r}.")
+
+    def toMoles(self, amounts, species, moles=False):
+        """Convert measurements of one species to moles (no-op when they already are moles)."""
+        amounts = np.atleast_1d(np.asarray(amounts, dtype=np.float64))
+        return amounts if moles else amounts / self.molarMasses[self.speciesIndex(species)]
+
+    def extent(self, amounts, reference=0, moles=False):
+        """Reaction extent (moles / coefficient) implied by measurements of the reference species."""
+        index = self.speciesIndex(reference)
+        return self.toMoles(amounts, index, moles) / self.coefficients[index]
+
+    def amounts(self, extent, moles=False):
+        """
+        Amount of every species for each reaction extent.
+
+        Returns: (n, species) float64 array - moles, or grams when moles is False
+        """
+        extent = np.atleast_1d(np.asarray(extent, dtype=np.float64))
+        result = extent[:, None] * self.coefficients
+        return result if moles else result * self.molarMasses
+
+    def compute(self, amounts, reference=0, moles=False):
+        """
+        Amount of every species from measurements of one species.
+
+        Args: amounts - scalar or 1-D array of measurements of the reference species
+              reference - index or formula of the measured species
+              moles - measurements and results in moles (True) or grams (False)
+
+        Returns: (n, species) float64 array; columns follow self.species
+        """
+        return self.amounts(self.extent(amounts, reference, moles), moles)
+
+    def requirements(self, amounts, reference=0, moles=False):
+        """Reactant amounts matching the measurements: (n, reactants) array."""
+        return self.compute(amounts, reference, moles)[:, self.reactantSlice]
+
+    def yields(self, amounts, reference=0, moles=False):
+        """Theoretical product yields for the measurements: (n, products) array."""
+        return self.compute(amounts, reference, moles)[:, self.productSlice]
+
+    def limiting(self, measured, moles=False):
+        """
+        Limiting reagent of every run from measurements of all reactants.
+
+        The reaction extent each reactant allows is its moles divided by its coefficient;
+        the run stops at the smallest one. NaN marks a reactant that was not measured
+        (treated as in excess). Ties go to the first reactant.
+
+        Args: measured - (n_runs, reactants) array of measured amounts (a 1-D array is one run)
+              moles - measurements and results in moles (True) or grams (False)
+
+        Returns: LimitingResult(limiting, extent, consumed, leftover, yields)
+                 limiting - int64 array, index of the limiting reactant, -1 when nothing was measured
+                 extent - float64 array, reaction extent of every run (NaN when nothing was measured)
+                 consumed - (n_runs, reactants) amounts used up
+                 leftover - (n_runs, reactants) excess left over (NaN for unmeasured reactants)
+                 yields - (n_runs, products) theoretical product yields
+        """
+        measured = np.atleast_2d(np.asarray(measured, dtype=np.float64))
+        reactantCount = len(self.reactants)
+        if measured.ndim != 2 or measured.shape[1] != reactantCount:
+            raise ValueError(f"Expected (n_runs, {reactantCount}) measurements, got shape {measured.shape}.")
+        perUnit = self.coefficients[self.reactantSlice] * (1.0 if moles else self.molarMasses[self.reactantSlice])
+        allowed = measured / perUnit
+        allowed[np.isnan(allowed)] = np.inf
+        limiting = np.argmin(allowed, axis=1)
+        extent = allowed[np.arange(len(allowed)), limiting]
+        unmeasured = np.isinf(extent)
+        limiting[unmeasured] = -1
+        extent[unmeasured] = np.nan
+        amounts = self.amounts(extent, moles)
+        consumed = amounts[:, self.reactantSlice]
+        leftover = measured - consumed
+        runs = np.flatnonzero(~unmeasured)
+        leftover[runs, limiting[runs]] = 0.0  # exactly used up, without rounding noise
+        return LimitingResult(limiting, extent, consumed, leftover, amounts[:, self.productSlice])
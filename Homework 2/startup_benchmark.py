@@ -0,0 +1,114 @@
+"""
+Startup benchmark for the Homework 2 helpers and stoichiometry tools.
+
+Each case runs in a fresh Python interpreter, so nothing is already imported. The
+script times the statement with perf_counter and records which heavy modules
+(NumPy, xlrd, tkinter) it pulled in. A case fails when its best time is over its
+budget or when it loaded a heavy module it is not allowed to. Importing a module
+must not open a window, read the equation file or load the periodic table; that
+work belongs to first use, which has its own cases and budgets.
+
+Usage:
+    python startup_benchmark.py --repeat 5 --output startup_results.json
+    python startup_benchmark.py --scale 2.0       # relax every budget on a slow machine
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("numpy", "xlrd", "tkinter")
+
+# name -> (statement, budget in milliseconds, heavy modules the statement may load)
+CASES = {
+    "import Chemistry": ("import Chemistry", 25, ()),
+    "import chemistry_cache": ("import chemistry_cache", 25, ()),
+    "import periodic_table": ("import periodic_table", 25, ()),
+    "import compute_stoichiometry": ("import compute_stoichiometry", 80, ("tkinter",)),
+    "import Lab_measurement": ("import Lab_measurement", 80, ("tkinter",)),
+    "import trial_all_reagents": ("import trial_all_reagents", 80, ("tkinter",)),
+    "first atomCount": ("from Chemistry import atomCount; atomCount('Hg3(PO4)2')", 25, ()),
+    "first symbolAndMasses": ("from Chemistry import symbolAndMasses; symbolAndMasses('PeriodicTableData.xls')",
+                              250, ("numpy",)),
+    "first Reaction": ("from reaction import Reaction; Reaction.fromFile()", 300, ("numpy",)),
+}
+
+# Only built-in modules are touched before the clock starts, so the statement pays for every import it makes.
+_PROBE = """\
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(repr((elapsed, [name for name in {heavy!r} if name in sys.modules])))
+"""
+
+
+def timeStatement(statement):
+    """
+    Run statement in a fresh interpreter in this folder.
+
+    Returns: (seconds, heavy modules loaded)
+    """
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    completed = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{completed.stderr}")
+    return ast.literal_eval(completed.stdout.strip().splitlines()[-1])
+
+
+def run(repeat, scale):
+    """
+    Time every case `repeat` times and keep the best run.
+
+    Returns: list of result dictionaries, one per case
+    """
+    # Build the periodic-table cache first so first-use cases measure the normal (cached) path.
+    timeStatement("from periodic_table import getPeriodicTable; getPeriodicTable()")
+    results = []
+    for name, (statement, budget, allowed) in CASES.items():
+        timings = [timeStatement(statement) for _ in range(repeat)]
+        best = min(seconds for seconds, _ in timings)
+        loaded = sorted({module for _, modules in timings for module in modules})
+        unexpected = [module for module in loaded if module not in allowed]
+        budgetMs = budget * scale
+        results.append({
+            "case": name,
+            "best_ms": round(best * 1000, 2),
+            "budget_ms": budgetMs,
+            "heavy_modules": loaded,
+            "passed": best * 1000 <= budgetMs and not unexpected,
+        })
+        status = "ok  " if results[-1]["passed"] else "FAIL"
+        extra = f"  unexpected: {', '.join(unexpected)}" if unexpected else ""
+        print(f"{status} {name:<32} {best * 1000:8.2f} ms (budget {budgetMs:.0f} ms){extra}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import and first-use times against budgets.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per case (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+    if args.repeat <= 0 or args.scale <= 0:
+        parser.error("--repeat and --scale must be positive")
+
+    results = run(args.repeat, args.scale)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "results": results}, file, indent=2)
+    failures = [result["case"] for result in results if not result["passed"]]
+    if failures:
+        print(f"{len(failures)} case(s) over budget: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())